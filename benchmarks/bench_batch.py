@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+"""Compare validating records with a form per record against validate_many.
+
+Run with: python -m benchmarks.bench_batch
+"""
+import functools
+import os
+import time
+from watson import validators
+from watson.form import Form, fields
+from benchmarks.support import report
+
+
+class ImportForm(Form):
+    username = fields.Text(required=True,
+                           validators=[validators.Length(min=3, max=30)])
+    email = fields.Email(required=True,
+                         validators=[validators.RegEx(r'^[^@]+@[^@]+$')])
+    first_name = fields.Text()
+    last_name = fields.Text()
+    age = fields.Text(validators=[validators.RegEx(r'^\d*$')])
+    country = fields.Select(options=['AU', 'NZ', 'GB', 'US'])
+
+
+def generate_records(number):
+    for index in range(number):
+        yield {
+            'username': ' user{0} '.format(index),
+            'email': 'user{0}@example.com'.format(index)
+            if index % 10 else 'invalid',
+            'first_name': 'First',
+            'last_name': 'Last',
+            'age': str(index % 100),
+            'country': 'AU',
+        }
+
+
+def per_record(records):
+    for record in records:
+        form = ImportForm()
+        form.data = record
+        form.is_valid()
+        yield form.data, form.errors
+
+
+def rows_per_second(validate, number):
+    records = list(generate_records(number))
+    start = time.perf_counter()
+    for _ in validate(records):
+        pass
+    return number / (time.perf_counter() - start)
+
+
+def run(number=20000, chunk_size=2000):
+    loop = rows_per_second(per_record, number)
+    batch = rows_per_second(ImportForm.validate_many, number)
+    rows = [('form per record', '{0:,.0f}'.format(loop), '1.00x'),
+            ('validate_many', '{0:,.0f}'.format(batch),
+             '{0:.2f}x'.format(batch / loop))]
+    workers = 1
+    while workers <= (os.cpu_count() or 1):
+        validate = functools.partial(ImportForm.validate_many,
+                                     workers=workers, chunk_size=chunk_size)
+        parallel = rows_per_second(validate, number * workers)
+        rows.append(('{0} processes'.format(workers),
+                     '{0:,.0f}'.format(parallel),
+                     '{0:.2f}x'.format(parallel / loop)))
+        workers *= 2
+    report('Validating {0} records per process'.format(number),
+           ('method', 'rows/sec', 'speedup'),
+           rows)
+
+
+if __name__ == '__main__':
+    run()
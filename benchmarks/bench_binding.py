@@ -0,0 +1,32 @@
+# -*- coding: utf-8 -*-
+"""Measure how binding data to a form scales with the number of fields.
+
+Run with: python -m benchmarks.bench_binding
+"""
+from benchmarks.support import generate_form, timed, report
+
+
+def run(sizes=(10, 100, 250, 500, 1000)):
+    rows = []
+    for size in sizes:
+        form_class = generate_form(size)
+        data = {'field_{0}'.format(index): 'value {0}'.format(index)
+                for index in range(size)}
+        form = form_class('form')
+        form.fields.items()  # bind to already instantiated fields
+
+        def bind():
+            form.data = data
+
+        elapsed = timed(bind, number=20)
+        rows.append((
+            size,
+            '{0:.1f}'.format(elapsed * 1e6),
+            '{0:.3f}'.format(elapsed * 1e6 / size)))
+    report('Binding data (form.data = dict)',
+           ('fields', 'total us', 'us per field'),
+           rows)
+
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,42 @@
+# -*- coding: utf-8 -*-
+"""Compare initializing fields for every form against cloning prototypes.
+
+Run with: python -m benchmarks.bench_instantiation
+"""
+from benchmarks.support import generate_form, timed, allocated, report
+
+
+def run(sizes=(10, 60, 200)):
+    rows = []
+    for size in sizes:
+        initialized = generate_form(size)
+        cloned = generate_form(size, clone_fields=True)
+        list(cloned('warmup').fields.values())  # build the prototypes
+
+        def build(form_class):
+            def instantiate():
+                # fields are generated lazily, so access every one of them
+                form = form_class('form')
+                list(form.fields.values())
+                return form
+            return instantiate
+
+        initialized_time = timed(build(initialized))
+        cloned_time = timed(build(cloned))
+        initialized_size = allocated(build(initialized))
+        cloned_size = allocated(build(cloned))
+        rows.append((
+            size,
+            '{0:.1f}'.format(initialized_time * 1e6),
+            '{0:.1f}'.format(cloned_time * 1e6),
+            '{0:.2f}x'.format(initialized_time / cloned_time),
+            initialized_size,
+            cloned_size))
+    report('Form instantiation (per form)',
+           ('fields', 'init us', 'clone us', 'speedup',
+            'init bytes', 'clone bytes'),
+           rows)
+
+
+if __name__ == '__main__':
+    run()
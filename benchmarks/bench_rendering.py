@@ -0,0 +1,37 @@
+# -*- coding: utf-8 -*-
+"""Compare Form.render with the rendering compiled for the form class.
+
+Run with: python -m benchmarks.bench_rendering
+"""
+from benchmarks.support import generate_form, timed, report
+
+
+def run(sizes=(10, 100, 1000)):
+    rows = []
+    for size in sizes:
+        data = {'field_{0}'.format(index): 'value {0}'.format(index)
+                for index in range(size)}
+        results = []
+        for attrs in ({'clone_fields': True}, {'compile_rendering': True}):
+            form_class = generate_form(size, **attrs)
+            form_class('form').render()  # compile the renderer
+
+            def render():
+                form = form_class('form')
+                form.data = data
+                return form.render()
+
+            results.append(timed(render, number=10))
+        rendered, compiled = results
+        rows.append((
+            size,
+            '{0:.1f}'.format(rendered * 1e6),
+            '{0:.1f}'.format(compiled * 1e6),
+            '{0:.1f}x'.format(rendered / compiled)))
+    report('Rendering a new form with data (form.render())',
+           ('fields', 'Form.render us', 'compiled us', 'speedup'),
+           rows)
+
+
+if __name__ == '__main__':
+    run()
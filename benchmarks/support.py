@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+# Support functions, classes for the benchmarks
+import gc
+import timeit
+import tracemalloc
+from watson.form import Form, fields
+
+
+def generate_form(size, base=Form, **attrs):
+    """Generate a Form class with size text fields.
+    """
+    for index in range(size):
+        attrs['field_{0}'.format(index)] = fields.Text(
+            label='Field {0}'.format(index), required=True)
+    return type('Form{0}'.format(size), (base,), attrs)
+
+
+def timed(func, number=100, repeat=7):
+    """Return the best time in seconds for a single call of func.
+    """
+    timer = timeit.Timer(func)
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+def allocated(func):
+    """Return the number of bytes allocated by func that are still alive.
+    """
+    gc.collect()
+    tracemalloc.start()
+    try:
+        result = func()  # noqa, keep the allocations alive
+        size, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return size
+
+
+def report(title, headers, rows):
+    """Print a simple table of results.
+    """
+    widths = [max(len(str(value)) for value in column)
+              for column in zip(headers, *rows)]
+    print(title)
+    for row in [headers] + list(rows):
+        print('  '.join(str(value).rjust(width)
+                        for value, width in zip(row, widths)))
+    print()
@@ -1,9 +1,14 @@
 # -*- coding: utf-8 -*-
 # Support functions, classes
+import asyncio
+import collections
 import enum
+import gc
 from io import BufferedReader, BytesIO
+import tracemalloc
 from watson.form import Form, fields
 from watson.form.decorators import has_csrf
+from watson.form.fields import _slot_names
 from wsgiref import util
 
 
@@ -45,6 +50,32 @@ Add\x20
     return environ
 
 
+def allocated_per_instance(factory, number=500):
+    gc.collect()
+    tracemalloc.start()
+    try:
+        instances = [factory() for _ in range(number)]
+        size, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return size / len(instances)
+
+
+class Unslotted(object):
+    # holds the state of a field or label in a __dict__ with its attributes
+    # in a ChainMap, as they were stored prior to using slots
+    def __init__(self, instance):
+        for name in _slot_names(instance.__class__):
+            value = getattr(instance, name, None)
+            if name == 'attributes':
+                value = collections.ChainMap(dict(value))
+            elif name == 'label':
+                value = Unslotted(value)
+            elif isinstance(value, list):
+                value = list(value)
+            setattr(self, name, value)
+
+
 form_user_mapping = {
     'first_name': (
         'personal',
@@ -63,11 +94,20 @@ class LoginForm(Form):
     email = fields.Text()
 
 
+class ClonedLoginForm(LoginForm):
+    clone_fields = True
+
+
 @has_csrf
 class ProtectedForm(Form):
     pass
 
 
+@has_csrf
+class ClonedProtectedForm(Form):
+    clone_fields = True
+
+
 class MultipleForm(Form):
     test = fields.Checkbox(name='checkbox[]', label='Test')
 
@@ -142,6 +182,84 @@ class SampleFormValidator(object):
             raise ValueError('Username does not match.')
 
 
+class CountingValidator(object):
+    def __init__(self, invalid=None):
+        self.invalid = invalid
+        self.calls = 0
+
+    def __call__(self, value, **kwargs):
+        self.calls += 1
+        if value == self.invalid:
+            raise ValueError('"{0}" is not allowed.'.format(value))
+
+
+class AsyncValidator(object):
+    def __init__(self, invalid=None, delay=0.1):
+        self.invalid = invalid
+        self.delay = delay
+
+    async def __call__(self, value, **kwargs):
+        await asyncio.sleep(self.delay)
+        if value == self.invalid:
+            raise ValueError('"{0}" is not available.'.format(value))
+
+
+class Rendezvous(object):
+    # completes only once all of the parties are waiting on it at once
+    def __init__(self, parties, timeout=1):
+        self.parties = parties
+        self.timeout = timeout
+        self.waiting = 0
+        self.event = None
+
+    async def wait(self):
+        if not self.waiting:
+            self.event = asyncio.Event()
+        event = self.event
+        self.waiting += 1
+        if self.waiting == self.parties:
+            self.waiting = 0
+            event.set()
+        await asyncio.wait_for(event.wait(), self.timeout)
+
+
+class RendezvousValidator(object):
+    def __init__(self, rendezvous, invalid=None):
+        self.rendezvous = rendezvous
+        self.invalid = invalid
+
+    async def __call__(self, value, **kwargs):
+        await self.rendezvous.wait()
+        if self.invalid is not None and value == self.invalid:
+            raise ValueError('"{0}" is not available.'.format(value))
+
+
+class AsyncFormValidator(object):
+    async def __call__(self, form):
+        await asyncio.sleep(0.1)
+        if form.username != 'Simon':
+            raise ValueError('Username does not match.')
+
+
+class AsyncForm(Form):
+    username = fields.Text(required=True,
+                           validators=[AsyncValidator(invalid='taken')])
+    email = fields.Email(validators=[AsyncValidator(invalid='a@b.com')])
+    coupon = fields.Text(validators=[AsyncValidator(invalid='expired')])
+    referrer = fields.Text(validators=[AsyncValidator(invalid='nobody')])
+
+
+class CountingUser(object):
+    def __init__(self, **attributes):
+        self.__dict__['reads'] = []
+        self.__dict__.update(attributes)
+
+    def __getattribute__(self, name):
+        if not name.startswith('_') and name != 'reads':
+            object.__getattribute__(self, 'reads').append(name)
+        return object.__getattribute__(self, name)
+
+
 class User(object):
     id = None
     username = None
@@ -0,0 +1,142 @@
+# -*- coding: utf-8 -*-
+from io import BufferedReader, BytesIO
+from pytest import raises
+from watson.http.messages import Request
+from watson.form.datastructures import Attributes, LazyFields, RequestData
+from tests.watson.form.support import sample_environ, environ_with_file
+
+
+def json_request(body):
+    body = body.encode('utf-8')
+    environ = sample_environ(REQUEST_METHOD='POST',
+                             CONTENT_TYPE='application/json',
+                             CONTENT_LENGTH=len(body))
+    environ['wsgi.input'] = BufferedReader(BytesIO(body))
+    return Request.from_environ(environ)
+
+
+class TestAttributes(object):
+
+    def test_create(self):
+        attributes = Attributes({'name': 'test'})
+        assert attributes['name'] == 'test'
+        assert attributes.get('type') is None
+        assert 'name' in attributes
+        assert len(attributes) == 1
+        assert attributes == {'name': 'test'}
+        assert repr(attributes) == "Attributes({'name': 'test'})"
+
+    def test_empty(self):
+        attributes = Attributes()
+        assert not attributes
+        with raises(KeyError):
+            attributes['name']
+        attributes['name'] = 'test'
+        assert attributes.copy() == {'name': 'test'}
+
+    def test_layered_over_parent(self):
+        parent = Attributes({'name': 'test', 'type': 'text'})
+        child = parent.new_child()
+        assert child.copy() == {'name': 'test', 'type': 'text'}
+        child['class'] = 'inline'
+        child['type'] = 'email'
+        assert dict(child.items()) == {
+            'name': 'test', 'type': 'email', 'class': 'inline'}
+        assert parent.copy() == {'name': 'test', 'type': 'text'}
+
+    def test_delete_from_child(self):
+        child = Attributes({'class': 'inline'}, parent={'name': 'test'})
+        del child['name']
+        del child['class']
+        assert 'name' not in child
+        assert not child
+        with raises(KeyError):
+            del child['name']
+        child['name'] = 'other'
+        assert list(child) == ['name']
+
+    def test_flatten(self):
+        attributes = Attributes({'type': 'text', 'name': 'test'})
+        flattened = attributes.flatten()
+        assert flattened == 'name="test" type="text"'
+        assert attributes.flatten() is flattened
+        assert attributes.flatten({'value': 'a', 'name': 'b', 'id': ''}) == \
+            'name="b" type="text" value="a"'
+        child = attributes.new_child()
+        child['class'] = 'inline'
+        assert child.flatten() == 'class="inline" name="test" type="text"'
+        attributes['id'] = 'test'
+        assert child.flatten() == \
+            'class="inline" id="test" name="test" type="text"'
+        del child['type']
+        assert child.flatten() == 'class="inline" id="test" name="test"'
+
+
+class TestLazyFields(object):
+
+    def test_create_on_access(self):
+        created = []
+
+        def factory(name):
+            created.append(name)
+            return name.upper()
+
+        fields = LazyFields(('one', 'two'), factory)
+        assert len(fields) == 2
+        assert list(fields) == ['one', 'two']
+        assert 'two' in fields
+        assert not created
+        assert fields['two'] == 'TWO'
+        assert fields['two'] == 'TWO'
+        assert created == ['two']
+        assert fields.instantiated == ('two',)
+        assert list(fields.values()) == ['ONE', 'TWO']
+        assert repr(fields) == '<LazyFields fields:2 instantiated:2>'
+
+    def test_modify(self):
+        fields = LazyFields(('one', 'two'), str.upper)
+        fields['three'] = 3
+        fields['one'] = 1
+        del fields['two']
+        assert dict(fields) == {'one': 1, 'three': 3}
+        with raises(KeyError):
+            fields['two']
+        with raises(KeyError):
+            del fields['two']
+
+
+class TestRequestData(object):
+
+    def test_form_request(self):
+        class UnparsedRequest(Request):
+            @property
+            def json_body(self):
+                raise AssertionError('JSON body should not be parsed')
+
+        request = UnparsedRequest.from_environ(environ_with_file())
+        data = RequestData(request)
+        assert not data.is_json
+        assert data['first_name'] == '1234'
+        assert data.get('file').filename == 'test.txt'
+        assert data.get('missing', 'default') == 'default'
+        assert 'test' in data
+        assert set(data) == {'first_name', 'test', 'file', 'submit'}
+        assert len(data) == 4
+        assert data.layers[1] is request.post
+        assert repr(data) == '<RequestData keys:4>'
+
+    def test_json_request(self):
+        data = RequestData(json_request('{"username": "simon"}'))
+        assert data.is_json
+        assert data['username'] == 'simon'
+        with raises(KeyError):
+            data['password']
+
+    def test_invalid_json_request(self):
+        assert not RequestData(json_request('{"username"'))
+        assert not RequestData(json_request('[1, 2]'))
+
+    def test_data_takes_precedence(self):
+        data = RequestData(json_request('{"username": "simon"}'),
+                           {'username': 'other'})
+        assert data['username'] == 'other'
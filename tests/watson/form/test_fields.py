@@ -1,9 +1,14 @@
 # -*- coding: utf-8 -*-
 import collections
+import hashlib
 from datetime import datetime
 from pytest import raises
-from watson.form import fields
-from tests.watson.form.support import SampleEnum
+from watson import filters, validators
+from watson.form import fields, uploads
+from watson.http.messages import Request
+from tests.watson.form.support import (SampleEnum, Unslotted,
+                                       allocated_per_instance,
+                                       environ_with_file)
 
 
 class TestFieldMixin(object):
@@ -16,6 +21,95 @@ class TestFieldMixin(object):
             field = fields.FieldMixin(definition=False)
             field.render_with_label()
 
+    def test_clone(self):
+        field = fields.Text(name='test', label='Test', required=True,
+                            definition=False)
+        clone = field.clone()
+        assert clone is not field
+        assert isinstance(clone, fields.Text)
+        assert clone.filters[0] is field.filters[0]
+        assert clone.validators[0] is field.validators[0]
+        assert clone.label.text == 'Test'
+        clone.value = 'value'
+        clone.attributes['class'] = 'cloned'
+        clone.label.text = 'Cloned'
+        clone.validators.append(123)
+        assert field.value is None
+        assert 'class' not in field.attributes
+        assert field.label.text == 'Test'
+        assert len(field.validators) == 1
+        assert str(clone) == '<input class="cloned" name="test" required="required" type="text" value="value" />'
+
+    def test_validate_fail_fast(self):
+        field = fields.Text(name='test', definition=False, validators=[
+            validators.RegEx('^[a-z]+$', message='regex'),
+            validators.Length(min=5, message='length')])
+        field.value = '123'
+        assert field.validate(None) == ['regex', 'length']
+        assert field.validate(None, fail_fast=True) == ['length']
+        assert field.cost == 22
+
+    def test_filter(self):
+        field = fields.Text(name='test', definition=False,
+                            filters=[filters.Upper()])
+        field.value = ' test '
+        field.filter()
+        assert field.value == 'TEST'
+        assert field.original_value == ' test '
+
+    def test_clone_from_definition(self):
+        definition = fields.Text(name='test')
+        assert definition.prototype is definition.prototype
+        clone = definition.clone_instance(None)
+        assert clone is not definition.prototype
+        assert str(clone) == str(definition.generate_instance(None))
+
+
+class TestMemoryFootprint(object):
+
+    def test_field_state_is_slotted(self):
+        for field in (fields.Text(name='test', definition=False),
+                      fields.Checkbox(name='test', values=1, definition=False),
+                      fields.Select(name='test', options=[1], definition=False),
+                      fields.Date(name='test', definition=False),
+                      fields.Submit(name='test', definition=False)):
+            assert not field.__dict__
+            assert not field.label.__dict__
+
+    def test_subclassed_fields(self):
+        class CustomField(fields.Text):
+            def __init__(self, name=None, value=None, custom=None, **kwargs):
+                self.custom = custom
+                super(CustomField, self).__init__(name, value, **kwargs)
+
+        field = CustomField(name='test', custom=1, definition=False)
+        clone = field.clone()
+        assert clone.custom == 1
+        assert str(clone) == '<input name="test" type="text" />'
+
+    def test_label_memory_reduction(self):
+        reference = allocated_per_instance(
+            lambda: Unslotted(fields.Label('Test')))
+        slotted = allocated_per_instance(lambda: fields.Label('Test'))
+        assert slotted < reference * 0.8
+
+    def test_field_memory_reduction(self):
+        def field():
+            return fields.Text(name='test', label='Test', required=True,
+                               definition=False)
+
+        reference = allocated_per_instance(lambda: Unslotted(field()))
+        slotted = allocated_per_instance(field)
+        assert slotted < reference * 0.9
+
+    def test_cloned_field_memory_reduction(self):
+        definition = fields.Text(name='test', label='Test', required=True)
+        initialized = allocated_per_instance(
+            lambda: definition.generate_instance(None))
+        cloned = allocated_per_instance(
+            lambda: definition.clone_instance(None))
+        assert cloned < initialized * 0.75
+
 
 class TestLabel(object):
 
@@ -159,6 +253,46 @@ class TestFileInputField(object):
         assert str(
             field_with_value) == '<input name="test" type="file" />'
 
+    def test_spool(self):
+        request = Request.from_environ(environ_with_file())
+        field = fields.File(name='file', spool=True, definition=False)
+        field.value = request.files['file']
+        field.filter()
+        assert isinstance(field.value, uploads.Upload)
+        assert field.value.filename == 'test.txt'
+        assert field.value.type == 'text/plain'
+        assert field.value.read().strip() == b'Testing 123.'
+        assert field.original_value is request.files['file']
+        field.value = request.files['file']
+        field.filter()
+        assert field.value.read().strip() == b'Testing 123.'
+
+    def test_limits(self):
+        request = Request.from_environ(environ_with_file())
+        field = fields.File(name='file', max_size=5,
+                            content_types=['text/plain'], definition=False)
+        assert str(field) == '<input accept="text/plain" name="file" type="file" />'
+        field.value = request.files['file']
+        field.filter()
+        assert field.validate(None) == [
+            'File must not be larger than 5 bytes.']
+        field.max_size = None
+        field.content_types = ['image/*']
+        field.value = request.files['file']
+        field.filter()
+        assert field.validate(None) == [
+            '"text/plain" is not an allowed file type.']
+
+    def test_digests(self):
+        request = Request.from_environ(environ_with_file())
+        field = fields.File(name='file', digests=['md5'], sniff=True,
+                            definition=False)
+        field.value = request.files['file']
+        field.filter()
+        assert field.value.digests['md5'] == hashlib.md5(
+            field.value.read()).hexdigest()
+        assert field.value.sniffed_type is None
+
     def test_render_with_label(self):
         field = fields.File(name='test', definition=False)
         assert field.render_with_label(
@@ -1,8 +1,17 @@
 # -*- coding: utf-8 -*-
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from io import BytesIO, BufferedReader
+import sys
 from pytest import raises
-from watson.form import Form, Multipart
+from watson import validators
+from watson.form import Form, Multipart, fields
+from watson.form.decorators import has_csrf
+from watson.form.rendering import compile_renderer
+from watson.form.types import FieldDescriptor, _compile_accessors
+from watson.form.validators import depends_on
 from watson.http.messages import Request
+from watson.http.sessions import Memory
 from tests.watson.form.support import (LoginForm, UploadForm, User, MultipleForm,
                                        form_user_mapping, Contact, Other,
                                        sample_environ, ProtectedForm,
@@ -10,7 +19,11 @@ from tests.watson.form.support import (LoginForm, UploadForm, User, MultipleForm
                                        ValuesProvider, FieldTypeForm,
                                        FieldTypeObject, ComplexValuesProvider,
                                        ComplexParent, ComplexForm,
-                                       ComplexChild)
+                                       ComplexChild, ClonedLoginForm,
+                                       ClonedProtectedForm, AsyncForm,
+                                       CountingValidator, CountingUser,
+                                       AsyncFormValidator, Rendezvous,
+                                       RendezvousValidator)
 
 
 class TestForm(object):
@@ -24,6 +37,13 @@ class TestForm(object):
         form2 = LoginForm('test')
         assert len(form2) == 5
 
+    def test_form_state_is_slotted(self):
+        form = LoginForm('test')
+        assert not vars(form)
+        form.bind(User())
+        assert not vars(form)
+        assert len(form.fields.instantiated) == 5
+
     def test_class_attribute(self):
         form = Form(_class='test')
         assert form.open() == '<form action="/" class="test" enctype="application/x-www-form-urlencoded" method="post" name="Form">'
@@ -66,6 +86,17 @@ class TestForm(object):
         form.data = request
         assert form.data['first_name'] == '1234'
 
+    def test_set_json_data_on_form(self):
+        body = b'{"username": "simon", "password": "test"}'
+        environ = sample_environ(REQUEST_METHOD='POST',
+                                 CONTENT_TYPE='application/json',
+                                 CONTENT_LENGTH=len(body))
+        environ['wsgi.input'] = BufferedReader(BytesIO(body))
+        form = LoginForm('test')
+        form.data = Request.from_environ(environ)
+        assert form.username == 'simon'
+        assert form.is_valid()
+
     def test_bind_object_to_form_with_mapping(self):
         form = LoginForm('test')
         user = User(username='simon', password='test')
@@ -92,6 +123,91 @@ class TestForm(object):
         assert user.password == 'test'
         assert user.personal.contact.email == 'simon.coulton@gmail.com'
 
+    def test_bind_compiles_accessors_once(self):
+        _compile_accessors.cache_clear()
+        for _ in range(3):
+            form = LoginForm('test')
+            form.bind(User(username='simon'), form_user_mapping)
+            assert form.username == 'simon'
+        info = _compile_accessors.cache_info()
+        assert info.misses == 1
+        assert info.hits == 2
+
+    def test_bind_lazily(self):
+        form = LoginForm('test')
+        user = CountingUser(username='simon', password='test')
+        form.bind(user, lazy=True)
+        assert user.reads == []
+        assert form.username == 'simon'
+        assert user.reads == ['username', 'username']
+        assert form.password == 'test'
+        assert form.first_name is None
+        form.bind(user, lazy=True)
+        form.data = {'username': 'simone'}
+        assert form.username == 'simone'
+        assert form.password is None
+
+    def test_bind_lazily_protected(self):
+        @has_csrf
+        class ProtectedLoginForm(LoginForm):
+            pass
+
+        form = ProtectedLoginForm('test', session=Memory(id='1'))
+        user = CountingUser(username='simon', password='test')
+        form.bind(user, lazy=True)
+        del user.reads[:]
+        form.data = {'username': 'simone'}
+        assert user.reads == []
+        assert form.username == 'simone'
+        assert form.password is None
+
+    def test_bind_lazily_resolves_accessors_once(self):
+        _compile_accessors.cache_clear()
+        form = LoginForm('test')
+        form.bind(User(username='simon'), form_user_mapping, lazy=True)
+        for field_name in form.fields:
+            form.fields[field_name].value
+        form.is_valid()
+        info = _compile_accessors.cache_info()
+        assert info.hits + info.misses == 1
+
+    def test_attribute_paths(self):
+        assert LoginForm.attribute_paths() == (
+            ('username',), ('password',), ('first_name',), ('last_name',),
+            ('email',))
+        assert LoginForm.attribute_paths(
+            form_user_mapping, ignored_fields=('password',)) == (
+            ('username',), ('personal', 'first_name'),
+            ('last_name',), ('personal', 'contact', 'email'))
+        assert LoginForm.relationship_paths(form_user_mapping) == (
+            ('personal',), ('personal', 'contact'))
+
+    def test_changed_data(self):
+        form = LoginForm('test')
+        user = User(username='simon', password='test')
+        user.personal.first_name = 'Simon'
+        form.bind(user, form_user_mapping)
+        assert form.changed_data == {}
+        user.username = 'changed'
+        form.data = {'username': ' simon ', 'password': 'newpass',
+                     'first_name': 'Simon', 'last_name': 'Coulton'}
+        assert form.is_valid()
+        assert form.changed_data == {'password': 'newpass',
+                                     'last_name': 'Coulton'}
+        assert user.username == 'changed'
+        assert user.password == 'newpass'
+
+    def test_changed_to_empty(self):
+        form = LoginForm('test')
+        user = User(username='simon', password='test')
+        user.personal.first_name = 0
+        form.bind(user, form_user_mapping)
+        form.data = {'username': 'simon', 'password': 'test',
+                     'first_name': ''}
+        assert form.changed_data == {'first_name': ''}
+        assert form.is_valid()
+        assert user.personal.first_name is None
+
     def test_bind_object_to_form_without_mapping(self):
         form = LoginForm('test')
         user = User(username='simon', password='test')
@@ -143,6 +259,46 @@ class TestForm(object):
         assert form.data == expected_data
         assert form.raw_data == expected_data
 
+    def test_data_generated_once_per_generation(self):
+        form = LoginForm('test')
+        form.data = {'username': 'simon'}
+        data = form.data
+        cached = form._cache['data']
+        assert form.data == data
+        assert form._cache['data'] is cached
+        form.username = 'simone'
+        assert form.data['username'] == 'simone'
+        assert form._cache['data'] is not cached
+        assert form.raw_data['username'] == 'simone'
+        errors = form.errors
+        cached = form._cache['errors']
+        assert form.errors == errors
+        assert form._cache['errors'] is cached
+        form.data = {'username': 'simon', 'password': 'test'}
+        assert form.errors == {}
+
+    def test_returned_data_can_be_modified(self):
+        form = LoginForm('test')
+        form.data = {'username': 'simon'}
+        data = form.data
+        data.pop('password')
+        del data['username']
+        form.raw_data.clear()
+        form.changed_data['username'] = 'other'
+        form.errors['password']['label'] = 'Other'
+        del form.errors['password']
+        assert form.data['username'] == 'simon'
+        assert 'password' in form.data
+        assert form.raw_data['username'] == 'simon'
+        assert form.changed_data == {'username': 'simon'}
+        assert form.errors['password']['label'] == 'password'
+
+    def test_data_regenerated_for_http_request_method(self):
+        form = LoginForm('test', method='PUT')
+        assert form.data['http_request_method'] == 'PUT'
+        form.http_request_method = 'DELETE'
+        assert form.data['http_request_method'] == 'DELETE'
+
     def test_filter_and_validate_input(self):
         form = LoginForm('test')
         data = {'username': 'simon '}
@@ -189,6 +345,18 @@ class TestForm(object):
         assert not form.username
         assert form.password
 
+    def test_set_data_on_large_form(self):
+        attrs = {'field_{0}'.format(index): fields.Text(
+            name='html_{0}'.format(index)) for index in range(1000)}
+        form = type('LargeForm', (Form,), attrs)()
+        assert form._schema.attribute_index['field_10'] == 'html_10'
+        form.data = {'html_{0}'.format(index): index
+                     for index in range(0, 1000, 2)}
+        form.data = dict(form.data, field_1='attribute')
+        assert form.field_998 == 998
+        assert form.field_1 == 'attribute'
+        assert form.field_999 is None
+
     def test_multiple_values(self):
         form = MultipleForm('test')
         data = 'checkbox[]=1&checkbox[]=2'
@@ -203,6 +371,461 @@ class TestForm(object):
         assert form.test == ['1', '2']
 
 
+class TestLazyFields(object):
+
+    def test_fields_created_on_access(self):
+        form = LoginForm('test')
+        assert len(form) == 5
+        assert 'email' in form.fields
+        assert list(form.fields) == [
+            'username', 'password', 'first_name', 'last_name', 'email']
+        assert not form.fields.instantiated
+        form.username = 'simon'
+        assert form.fields['email'].value is None
+        assert form.fields.instantiated == ('username', 'email')
+        assert form.username == 'simon'
+
+    def test_access_on_new_form_class(self):
+        class NewForm(Form):
+            text = fields.Text(value='test')
+
+        form = NewForm()
+        assert form.text == 'test'
+        assert isinstance(NewForm.text, FieldDescriptor)
+
+    def test_all_fields_used_when_required(self):
+        form = LoginForm('test')
+        form.fields['username']
+        assert not form.is_valid()
+        assert len(form.fields.instantiated) == 5
+        assert len(form.data) == 5
+        form = LoginForm('test')
+        assert str(form) == str(LoginForm('test'))
+        assert len(form.fields.instantiated) == 5
+
+    def test_missing_field(self):
+        form = LoginForm('test')
+        with raises(KeyError):
+            form.fields['missing']
+
+
+class TestConcurrentInstantiation(object):
+
+    def test_class_is_not_modified(self):
+        attributes = dict(vars(LoginForm))
+        definition_kwargs = dict(LoginForm._schema.definitions['username'].kwargs)
+        form = LoginForm('test', method='PUT')
+        form.data = {'username': 'simon'}
+        form.is_valid()
+        assert form.http_request_method == 'PUT'
+        assert dict(vars(LoginForm)) == attributes
+        assert dict(LoginForm._schema.definitions['username'].kwargs) == \
+            definition_kwargs
+        assert not hasattr(LoginForm('test'), 'http_request_method')
+        with raises(TypeError):
+            LoginForm._schema.definitions['username'].kwargs['form_'] = form
+
+    def test_definitions_are_not_modified(self):
+        class DateForm(Form):
+            date = fields.Date(filters=[])
+
+        DateForm().fields['date']
+        field = DateForm().fields['date']
+        assert len(field.filters) == 2
+        assert DateForm._schema.definitions['date'].kwargs['filters'] == []
+
+    def test_nested_arguments_are_not_shared(self):
+        class SelectForm(Form):
+            select = fields.Select(options={'A': [1, 2]})
+
+        form = SelectForm()
+        form.fields['select'].options['A'].append(3)
+        form.fields['select'].options['B'] = [4]
+        assert SelectForm().fields['select'].options == {'A': [1, 2]}
+        assert SelectForm._schema.definitions['select'].kwargs['options'] == \
+            {'A': [1, 2]}
+
+    def test_no_cross_talk_between_threads(self):
+        def submit(index):
+            form_class = ClonedLoginForm if index % 2 else LoginForm
+            form = form_class('form_{0}'.format(index),
+                              method='PUT' if index % 3 else 'POST')
+            username = 'user_{0}'.format(index)
+            form.data = {'username': username, 'password': 'test'}
+            valid = form.is_valid()
+            field_forms = [field.form for field in form.fields.values()
+                           if field.name != 'HTTP_REQUEST_METHOD']
+            return (valid, form.username == username,
+                    all(field_form is form for field_form in field_forms))
+
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                results = list(executor.map(submit, range(400)))
+        finally:
+            sys.setswitchinterval(interval)
+        assert all(all(result) for result in results)
+
+
+class TestClonedFields(object):
+
+    def test_render_matches_initialized_fields(self):
+        assert str(ClonedLoginForm('test')) == str(LoginForm('test'))
+
+    def test_instances_are_independent(self):
+        form = ClonedLoginForm('test')
+        other = ClonedLoginForm('other')
+        form.data = {'username': 'simon ', 'password': 'test'}
+        assert form.is_valid()
+        assert form.username == 'simon'
+        assert not other.username
+        assert not other.is_valid()
+        assert form.fields['username'].form is form
+        assert other.fields['username'].form is other
+
+    def test_mutable_state_is_independent(self):
+        class SelectForm(Form):
+            clone_fields = True
+            select = fields.Select(options=['a', 'b'],
+                                   default_value=['a'])
+            checkbox = fields.Checkbox(values=[('a', 1)])
+            optgroups = fields.Select(options={'A': [1, 2]})
+
+        form = SelectForm('test')
+        form.fields['select'].options.append('z')
+        form.fields['select'].default_value.append('b')
+        form.fields['checkbox'].values.append(('b', 2))
+        form.fields['optgroups'].options['A'].append(3)
+        form.fields['optgroups'].options['B'] = [4]
+        other = SelectForm('other')
+        assert other.fields['select'].options == ['a', 'b']
+        assert other.fields['select'].default_value == ['a']
+        assert other.fields['checkbox'].values == [('a', 1)]
+        assert other.fields['optgroups'].options == {'A': [1, 2]}
+
+    def test_csrf_tokens_are_independent(self):
+        session, other_session = Memory(id='1'), Memory(id='2')
+        form = ClonedProtectedForm('form', session=session)
+        other = ClonedProtectedForm('form', session=other_session)
+        form.data = {'form_csrf_token': session['form_csrf_token']}
+        other.data = {'form_csrf_token': session['form_csrf_token']}
+        assert form.is_valid()
+        assert not other.is_valid()
+
+
+class TestAsyncValidation(object):
+
+    def test_sync_validators(self):
+        form = LoginForm(validators=[SampleFormValidator()])
+        form.data = {'username': 'simon '}
+        assert not asyncio.run(form.is_valid_async())
+        assert form.username == 'simon'
+        assert form.errors == {
+            'password': {'messages': ['Value is required'],
+                         'label': 'password'}}
+        form.data = {'username': 'Simone', 'password': 'test'}
+        assert not asyncio.run(form.is_valid_async())
+        assert form.errors == {'form': {'messages': [
+            'Username does not match.'], 'label': 'Form'}}
+
+    def test_validators_awaited_concurrently(self):
+        # each validator waits until all of the others in the same phase
+        # are waiting too, so validation only completes when concurrent
+        field_rendezvous, form_rendezvous = Rendezvous(4), Rendezvous(2)
+
+        class ConcurrentForm(Form):
+            username = fields.Text(
+                validators=[RendezvousValidator(field_rendezvous)])
+            email = fields.Email(validators=[
+                RendezvousValidator(field_rendezvous, invalid='a@b.com')])
+            coupon = fields.Text(validators=[
+                RendezvousValidator(field_rendezvous, invalid='expired')])
+            referrer = fields.Text(
+                validators=[RendezvousValidator(field_rendezvous)])
+
+        form = ConcurrentForm(validators=[
+            RendezvousValidator(form_rendezvous),
+            RendezvousValidator(form_rendezvous)])
+        form.data = {'username': 'Simon', 'email': 'a@b.com',
+                     'coupon': 'expired', 'referrer': 'someone'}
+        assert not asyncio.run(form.is_valid_async())
+        assert set(form.errors) == {'email', 'coupon'}
+        form.data = {'username': 'Simon', 'email': 'c@d.com'}
+        assert asyncio.run(form.is_valid_async())
+
+    def test_sync_validation_rejects_async_validators(self):
+        form = AsyncForm()
+        form.data = {'username': 'taken'}
+        with raises(TypeError):
+            form.is_valid()
+        form = LoginForm(validators=[AsyncFormValidator()])
+        form.data = {'username': 'Simon', 'password': 'test'}
+        with raises(TypeError):
+            form.is_valid()
+
+    def test_form_validator_errors(self):
+        form = AsyncForm(validators=[AsyncFormValidator(),
+                                     AsyncFormValidator()])
+        form.data = {'username': 'Simone'}
+        assert not asyncio.run(form.is_valid_async())
+        assert form.errors['form']['messages'] == [
+            'Username does not match.', 'Username does not match.']
+
+    def test_hydrates_bound_object(self):
+        user = User()
+        form = AsyncForm()
+        form.bind(user, hydrate=False)
+        form.data = {'username': 'Simon'}
+        assert asyncio.run(form.is_valid_async())
+        assert user.username == 'Simon'
+
+
+class TestFailFast(object):
+
+    def test_stops_at_first_error(self):
+        form = LoginForm()
+        form.data = {}
+        assert not form.is_valid(fail_fast=True)
+        assert len(form.errors) == 1
+        assert not form.is_valid()
+        assert set(form.errors) == {'username', 'password'}
+
+    def test_cheapest_field_first(self):
+        class RegExForm(Form):
+            code = fields.Text(validators=[
+                validators.RegEx('^[a-z]+$', message='regex')])
+            name = fields.Text(required=True)
+
+        form = RegExForm(fail_fast=True)
+        form.data = {'code': '123'}
+        assert not form.is_valid()
+        assert list(form.errors) == ['name']
+        form.data = {'code': '123', 'name': 'Simon'}
+        assert not form.is_valid()
+        assert list(form.errors) == ['code']
+
+    def test_form_validators(self):
+        form = LoginForm(fail_fast=True, validators=[
+            SampleFormValidator(), SampleFormValidator()])
+        form.data = {'username': 'Simone', 'password': 'test'}
+        assert not form.is_valid()
+        assert form.errors['form']['messages'] == ['Username does not match.']
+
+    def test_async(self):
+        form = AsyncForm(fail_fast=True, validators=[
+            AsyncFormValidator(), AsyncFormValidator()])
+        form.data = {'email': 'a@b.com', 'coupon': 'expired'}
+        assert not asyncio.run(form.is_valid_async())
+        assert len(form.errors) == 1
+        assert not asyncio.run(form.is_valid_async(fail_fast=False))
+        assert set(form.errors) == {'username', 'email', 'coupon'}
+        form.data = {'username': 'Simone'}
+        assert not asyncio.run(form.is_valid_async())
+        assert form.errors['form']['messages'] == ['Username does not match.']
+
+    def test_async_after_sync(self):
+        form = LoginForm()
+        form.data = {}
+        assert not form.is_valid(fail_fast=True)
+        assert len(form.errors) == 1
+        assert not asyncio.run(form.is_valid_async())
+        assert set(form.errors) == {'username', 'password'}
+
+
+class TestValidateFields(object):
+
+    def test_only_named_fields_validated(self):
+        form = LoginForm(validators=[SampleFormValidator()])
+        form.data = {'username': ' Simone ', 'password': None}
+        assert form.validate_fields('username') == {}
+        assert form.username == 'Simone'
+        assert form.fields['password'].errors == []
+        assert not form.validated
+        assert form.validate_fields('username', 'password') == {
+            'password': {'messages': ['Value is required'],
+                         'label': 'password'}}
+
+    def test_form_validators(self):
+        form = LoginForm(validators=[SampleFormValidator()])
+        form.data = {'username': 'Simone'}
+        assert form.validate_fields('username', form_validators=True) == {
+            'form': {'messages': ['Username does not match.'],
+                     'label': 'Form'}}
+
+    def test_invalid_field_name(self):
+        form = LoginForm()
+        with raises(KeyError):
+            form.validate_fields('invalid')
+
+    def test_form_validators_with_dependencies(self):
+        validator = depends_on('password')(CountingValidator())
+        form = LoginForm(validators=[validator, SampleFormValidator()])
+        form.data = {'username': 'Simone', 'password': 'test'}
+        assert form.validate_fields('username', form_validators=True) == {
+            'form': {'messages': ['Username does not match.'],
+                     'label': 'Form'}}
+        assert validator.calls == 0
+        form.validate_fields('password', form_validators=True)
+        assert validator.calls == 1
+
+
+class TestIncrementalValidation(object):
+
+    def test_only_changed_fields_are_validated(self):
+        username_validator = CountingValidator('taken')
+        password_validator = CountingValidator()
+
+        class IncrementalForm(Form):
+            incremental = True
+            username = fields.Text(validators=[username_validator])
+            password = fields.Password(validators=[password_validator])
+
+        form = IncrementalForm()
+        form.data = {'username': ' taken ', 'password': 'test'}
+        assert not form.is_valid()
+        assert form.raw_data['username'] == ' taken '
+        form.data = {'username': ' taken ', 'password': 'test1'}
+        assert not form.is_valid()
+        assert username_validator.calls == 1
+        assert password_validator.calls == 2
+        assert form.username == 'taken'
+        assert form.raw_data['username'] == ' taken '
+        assert form.errors['username']['messages'] == [
+            '"taken" is not allowed.']
+        form.data = {'username': 'simon', 'password': 'test1'}
+        assert form.is_valid()
+        assert username_validator.calls == 2
+        assert password_validator.calls == 2
+
+    def test_form_validators_only_run_on_change(self):
+        validator = CountingValidator()
+        form = LoginForm(incremental=True,
+                         validators=[lambda form: validator(form)])
+        form.data = {'username': 'Simon', 'password': 'test'}
+        assert form.is_valid()
+        form.data = {'username': 'Simon', 'password': 'test'}
+        assert form.is_valid()
+        assert validator.calls == 1
+        form.data = {'username': 'Simon', 'password': 'test2'}
+        assert form.is_valid()
+        assert validator.calls == 2
+
+    def test_form_validators_with_dependencies(self):
+        username_validator = CountingValidator()
+        password_validator = CountingValidator(invalid='test')
+
+        @depends_on('username')
+        def validate_username(form):
+            username_validator(form.username)
+
+        @depends_on('password')
+        def validate_password(form):
+            password_validator(form.password)
+
+        form = LoginForm(incremental=True,
+                         validators=[validate_username, validate_password])
+        form.data = {'username': 'Simon', 'password': 'test'}
+        assert not form.is_valid()
+        form.data = {'username': 'Simon', 'password': 'test2'}
+        assert form.is_valid()
+        form.data = {'username': 'Simone', 'password': 'test2'}
+        assert form.is_valid()
+        assert username_validator.calls == 2
+        assert password_validator.calls == 2
+
+
+class TestCompiledRendering(object):
+
+    def assert_renders_same(self, form_class, modify=None, **kwargs):
+        compiled_class = type(form_class.__name__, (form_class,),
+                              {'compile_rendering': True})
+        form, compiled = form_class(**kwargs), compiled_class(**kwargs)
+        for form_ in (form, compiled):
+            form_.data = {'username': 'simon', 'password': 'test'}
+            if modify:
+                modify(form_)
+        for _ in range(2):
+            assert compiled.render() == form.render()
+            assert compiled.render('p', False) == form.render('p', False)
+
+    def test_renders_same_as_form(self):
+        self.assert_renders_same(LoginForm)
+        self.assert_renders_same(LoginForm, method='put')
+        self.assert_renders_same(FieldTypeForm)
+        self.assert_renders_same(UploadForm)
+
+    def test_compiled_once_per_class(self):
+        compiled_class = type('LoginForm', (LoginForm,),
+                              {'compile_rendering': True})
+        renderer = compile_renderer(compiled_class)
+        assert compile_renderer(compiled_class) is renderer
+        assert compiled_class._renderers == {True: renderer}
+        assert '_renderers' not in vars(LoginForm)
+        form = compiled_class(method='put')
+        html = renderer(form, '<div>', '</div>')
+        assert html == LoginForm(method='put').render()
+        assert 'name="HTTP_REQUEST_METHOD"' in html
+        del form.fields['email']
+        assert renderer(form, '<div>', '</div>') is None
+
+    def test_renders_modified_fields(self):
+        def modify(form):
+            form.fields['username'].attributes['class'] = 'changed'
+            form.fields['password'].label.text = 'Secret'
+            form.fields['email'].label.attributes['class'] = 'changed'
+        self.assert_renders_same(LoginForm, modify)
+
+    def test_renders_changed_fields(self):
+        def modify(form):
+            del form.fields['email']
+        self.assert_renders_same(LoginForm, modify)
+
+
+class TestValidateMany(object):
+
+    def test_validate_records(self):
+        records = [
+            {'username': 'simon ', 'password': 'test'},
+            {'username': 'simon'},
+            {'username': 'Simon', 'password': 'test', 'email': 'a@b.com'},
+        ]
+        results = list(LoginForm.validate_many(iter(records)))
+        assert len(results) == 3
+        data, errors = results[0]
+        assert data['username'] == 'simon'
+        assert not errors
+        data, errors = results[1]
+        assert data['password'] is None
+        assert errors == {'password': {'messages': ['Value is required'],
+                                       'label': 'password'}}
+        data, errors = results[2]
+        assert data['email'] == 'a@b.com'
+        assert not errors
+
+    def test_matches_form_validation(self):
+        records = [{'username': 'Simon', 'password': 'test'},
+                   {'username': 'Simone', 'password': 'test'}]
+        results = LoginForm.validate_many(
+            records, validators=[SampleFormValidator()])
+        for record, (data, errors) in zip(records, results):
+            form = LoginForm(validators=[SampleFormValidator()])
+            form.data = record
+            assert form.is_valid() is not bool(errors)
+            assert form.data == data
+            assert form.errors == errors
+
+    def test_validate_across_processes(self):
+        records = [{'username': 'user{0}'.format(index),
+                    'password': 'test' if index % 3 else None}
+                   for index in range(25)]
+        expected = list(LoginForm.validate_many(records))
+        results = list(LoginForm.validate_many(
+            iter(records), workers=2, chunk_size=4))
+        assert results == expected
+        assert not list(LoginForm.validate_many([], workers=2))
+
+
 class TestValuesProvider(object):
     def test_values_provider(self):
         form = MultipleForm('test', values_provider=ValuesProvider())
@@ -235,6 +858,17 @@ class TestMultiPartForm(object):
         ) == '<form action="/" enctype="multipart/form-data" method="post" name="test">'
         assert form.open(action='/put') == '<form action="/put" enctype="multipart/form-data" method="post" name="test">'
 
+    def test_spooled_upload_read_by_each_form(self):
+        class SpooledUploadForm(Form):
+            file = fields.File(spool=True)
+
+        request = Request.from_environ(environ_with_file())
+        for form in (SpooledUploadForm('test'), SpooledUploadForm('other')):
+            for _ in range(2):
+                form.data = request
+                assert form.is_valid()
+                assert form.file.read().strip() == b'Testing 123.'
+
 
 class TestFormProcessingCsrfRequest(object):
 
@@ -298,3 +932,42 @@ class TestMultipleInputTypesBind(object):
         assert form.checkbox == [1, 2]
         assert form.checkbox_multi == [1]
         assert form.radio_enum == 'red'
+
+
+class TestFormSchema(object):
+
+    def test_compiled_schema(self):
+        schema = LoginForm._schema
+        assert schema.attributes == (
+            'username', 'password', 'first_name', 'last_name', 'email')
+        assert schema.names == schema.attributes
+        assert schema.name_index['email'] == 'email'
+        assert not schema.multipart
+        assert LoginForm.defined_fields is not None
+
+    def test_html_names_and_flags(self):
+        assert UploadForm._schema.multipart
+        assert UploadForm._schema.name_index['upload_image'] == 'image'
+        assert MultipleForm._schema.name_index['checkbox[]'] == 'test'
+        assert 'test' in MultipleForm._schema.multiple_value
+        assert ProtectedForm._schema.names == ('csrf_token',)
+
+    def test_schema_is_immutable(self):
+        with raises(AttributeError):
+            LoginForm._schema.multipart = True
+        with raises(TypeError):
+            LoginForm._schema.definitions['username'] = None
+
+    def test_inherited_fields(self):
+        LoginForm('test')  # instantiating the parent must not affect children
+
+        class ExtendedLoginForm(LoginForm):
+            remember_me = fields.Checkbox(values=1)
+            email = None
+
+        schema = ExtendedLoginForm._schema
+        assert schema.attributes == (
+            'username', 'password', 'first_name', 'last_name', 'remember_me')
+        form = ExtendedLoginForm()
+        assert len(form) == 5
+        assert 'email' not in form.fields
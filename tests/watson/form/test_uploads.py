@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+import hashlib
+from io import BytesIO
+from pytest import raises
+from watson.form import uploads
+from watson.http.messages import Request
+from tests.watson.form.support import environ_with_file
+
+
+class RecordingStream(BytesIO):
+    # records the number of bytes read, optionally refusing to seek
+    def __init__(self, data, seekable=True):
+        super(RecordingStream, self).__init__(data)
+        self.read_size = 0
+        self._seekable = seekable
+
+    def read(self, size=-1):
+        data = super(RecordingStream, self).read(size)
+        self.read_size += len(data)
+        return data
+
+    def seekable(self):
+        return self._seekable
+
+
+class TestSpool(object):
+
+    def test_spool_bytes(self):
+        upload = uploads.spool(b'Testing 123.')
+        assert upload.size == 12
+        assert upload.in_memory
+        assert upload.read() == b'Testing 123.'
+        assert repr(upload) == '<Upload filename:None type:None size:12>'
+
+    def test_spool_to_disk(self):
+        upload = uploads.spool(BytesIO(b'a' * 100), max_memory_size=10,
+                               chunk_size=8)
+        assert upload.size == 100
+        assert not upload.in_memory
+        assert b''.join(upload) == b'a' * 100
+        upload.close()
+
+    def test_spool_iterable(self):
+        upload = uploads.spool(iter([b'Testing', '', ' 123.']))
+        assert upload.read() == b'Testing 123.'
+
+    def test_spool_max_size(self):
+        source = RecordingStream(b'a' * 100)
+        with raises(uploads.UploadError):
+            uploads.spool(source, max_size=20, chunk_size=8)
+        assert source.read_size == 24
+        assert source.tell() == 0
+
+    def test_spool_rewinds_source(self):
+        request = Request.from_environ(environ_with_file())
+        upload = uploads.spool(request.files['file'])
+        assert uploads.spool(request.files['file']).read() == upload.read()
+        source = BytesIO(b'Testing 123.')
+        source.seek(8)
+        assert uploads.spool(source).read() == b'Testing 123.'
+        assert source.tell() == 8
+
+    def test_spool_read_unseekable_source(self):
+        source = RecordingStream(b'Testing 123.', seekable=False)
+        assert uploads.spool(source).read() == b'Testing 123.'
+        with raises(uploads.UploadError):
+            uploads.spool(source)
+
+    def test_spool_content_types(self):
+        request = Request.from_environ(environ_with_file())
+        upload = uploads.spool(request.files['file'],
+                               content_types=['text/*'])
+        assert upload.type == 'text/plain'
+        with raises(uploads.UploadError):
+            uploads.spool(request.files['file'], content_types=['image/*'])
+
+    def test_spool_digests_and_sniff(self):
+        png = b'\x89PNG\r\n\x1a\n' + b'\x00' * 100
+        upload = uploads.spool(iter([png[:4], png[4:]]), digests=['sha256'],
+                               sniff_type=True)
+        assert upload.digests == {'sha256': hashlib.sha256(png).hexdigest()}
+        assert upload.sniffed_type == 'image/png'
+        assert uploads.spool(b'%PDF-1.4', sniff_type=True).sniffed_type == \
+            'application/pdf'
+        with raises(uploads.UploadError):
+            uploads.spool(png, sniff_type=True, content_types=['text/*'])
+
+    def test_spool_undetected_type(self):
+        class Source(BytesIO):
+            type = 'image/png'
+
+        upload = uploads.spool(Source(b'<?php system($_GET["c"]); ?>'),
+                               sniff_type=True)
+        assert upload.sniffed_type is None
+        with raises(uploads.UploadError) as exc:
+            uploads.spool(Source(b'<?php system($_GET["c"]); ?>'),
+                          sniff_type=True, content_types=['image/*'])
+        assert str(exc.value) == uploads.UNKNOWN_TYPE_MESSAGE
+
+
+class TestChunks(object):
+
+    def test_file_like(self):
+        assert list(uploads.chunks(BytesIO(b'abcdefg'), chunk_size=3)) == [
+            b'abc', b'def', b'g']
+
+
+class TestIsAllowedType(object):
+
+    def test_matches(self):
+        assert uploads.is_allowed_type('image/png', ['image/*'])
+        assert uploads.is_allowed_type('Text/Plain; charset=utf-8',
+                                       ['text/plain'])
+        assert uploads.is_allowed_type(None, ['*/*'])
+        assert not uploads.is_allowed_type('text/plain', ['image/*'])
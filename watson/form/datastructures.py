@@ -0,0 +1,310 @@
+# -*- coding: utf-8 -*-
+import bisect
+import collections.abc
+from watson.html.elements import flatten_attributes
+
+
+_DELETED = object()
+
+
+class Attributes(collections.abc.MutableMapping):
+
+    """A compact mapping of the HTML attributes for an element.
+
+    Attributes can be layered over a parent mapping, in which case values are
+    read from the parent until they are modified, and modifications are only
+    ever stored on the child. The storage for the child is not created until
+    the first modification, so layered attributes that are never modified
+    cost a single small object.
+
+    The flattened HTML representation of the attributes is cached until the
+    attributes (or their parent) are modified, see flatten().
+
+    Example:
+
+    .. code-block:: python
+
+        attributes = Attributes({'type': 'text'})
+        child = attributes.new_child()
+        child['class'] = 'inline'
+        child.copy()  # {'type': 'text', 'class': 'inline'}
+        attributes.copy()  # {'type': 'text'}
+    """
+    __slots__ = ('_data', '_parent', '_version', '_flattened')
+
+    def __init__(self, data=None, parent=None):
+        """Initialize the attributes.
+
+        Args:
+            data (dict): the attributes, owned by the new object
+            parent (mapping): the attributes to fall back to
+        """
+        self._data = data
+        self._parent = parent
+        self._version = 0
+        self._flattened = None
+
+    @property
+    def version(self):
+        """The number of times the attributes (and their parents) have been
+        modified.
+        """
+        if isinstance(self._parent, Attributes):
+            return self._version + self._parent.version
+        return self._version
+
+    def flatten(self, extra=None):
+        """Flatten the attributes into a string of HTML attributes.
+
+        The flattened attributes are cached until the attributes are
+        modified, so that only the extra attributes need to be flattened
+        each time the element is rendered.
+
+        Args:
+            extra (dict): attributes that are added to (or override) the
+                          attributes for this call only
+
+        Example:
+
+        .. code-block:: python
+
+            attributes = Attributes({'type': 'text', 'name': 'test'})
+            attributes.flatten({'value': 1})  # 'name="test" type="text" value="1"'
+        """
+        version = self.version
+        flattened = self._flattened
+        if flattened is None or flattened[0] != version:
+            attributes = self.copy()
+            names = sorted(attributes)
+            pairs = [flatten_attributes({name: attributes[name]})
+                     for name in names]
+            flattened = self._flattened = (
+                version, names, pairs, ' '.join(pair for pair in pairs if pair))
+        if not extra:
+            return flattened[3]
+        names, pairs = list(flattened[1]), list(flattened[2])
+        for name, value in extra.items():
+            pair = flatten_attributes({name: value})
+            index = bisect.bisect_left(names, name)
+            if index < len(names) and names[index] == name:
+                pairs[index] = pair
+            else:
+                names.insert(index, name)
+                pairs.insert(index, pair)
+        return ' '.join(pair for pair in pairs if pair)
+
+    def new_child(self):
+        """Return new attributes that are layered over these attributes.
+        """
+        return self.__class__(parent=self)
+
+    def copy(self):
+        """Return a flattened copy of the attributes as a dict.
+        """
+        if self._parent is None:
+            attributes = {}
+        elif isinstance(self._parent, Attributes):
+            attributes = self._parent.copy()
+        else:
+            attributes = dict(self._parent)
+        if self._data:
+            for key, value in self._data.items():
+                if value is _DELETED:
+                    attributes.pop(key, None)
+                else:
+                    attributes[key] = value
+        return attributes
+
+    def items(self):
+        return self.copy().items()
+
+    def get(self, key, default=None):
+        if self._data is not None and key in self._data:
+            value = self._data[key]
+            return default if value is _DELETED else value
+        if self._parent is not None:
+            return self._parent.get(key, default)
+        return default
+
+    def __getitem__(self, key):
+        value = self.get(key, _DELETED)
+        if value is _DELETED:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key, value):
+        if self._data is None:
+            self._data = {}
+        self._data[key] = value
+        self._version += 1
+
+    def __delitem__(self, key):
+        if key not in self:
+            raise KeyError(key)
+        if self._parent is not None and key in self._parent:
+            self[key] = _DELETED
+        else:
+            del self._data[key]
+            self._version += 1
+
+    def __contains__(self, key):
+        return self.get(key, _DELETED) is not _DELETED
+
+    def __iter__(self):
+        return iter(self.copy())
+
+    def __len__(self):
+        return len(self.copy())
+
+    def __repr__(self):
+        return '{0}({1!r})'.format(self.__class__.__name__, self.copy())
+
+
+class LazyFields(collections.abc.MutableMapping):
+
+    """An ordered mapping of fields that are only created when accessed.
+
+    Iterating over the keys, checking membership and the length of the
+    mapping will never create a field, whereas retrieving values (including
+    via values() and items()) will create any fields that have not yet
+    been created.
+    """
+    __slots__ = ('_names', '_pending', '_factory', '_fields')
+
+    def __init__(self, names, factory):
+        """Initialize the fields.
+
+        Args:
+            names (iterable): the names of the fields in order
+            factory (callable): creates the field for the name passed to it
+        """
+        self._names = list(names)
+        self._pending = set(self._names)
+        self._factory = factory
+        self._fields = {}
+
+    @property
+    def instantiated(self):
+        """The names of the fields that have been created, in order.
+        """
+        return tuple(name for name in self._names if name in self._fields)
+
+    def __getitem__(self, name):
+        try:
+            return self._fields[name]
+        except KeyError:
+            if name not in self._pending:
+                raise
+        field = self._factory(name)
+        self._fields[name] = field
+        self._pending.discard(name)
+        return field
+
+    def __setitem__(self, name, field):
+        if name not in self._fields and name not in self._pending:
+            self._names.append(name)
+        self._pending.discard(name)
+        self._fields[name] = field
+
+    def __delitem__(self, name):
+        if name not in self:
+            raise KeyError(name)
+        self._names.remove(name)
+        self._pending.discard(name)
+        self._fields.pop(name, None)
+
+    def __contains__(self, name):
+        return name in self._fields or name in self._pending
+
+    def __iter__(self):
+        return iter(list(self._names))
+
+    def __len__(self):
+        return len(self._names)
+
+    def __repr__(self):
+        return '<{0} fields:{1} instantiated:{2}>'.format(
+            self.__class__.__name__, len(self), len(self._fields))
+
+
+class RequestData(collections.abc.Mapping):
+
+    """A read-only view of the data submitted with a request.
+
+    Values are read directly from the request rather than being copied into
+    a new dict. JSON requests are read from the decoded body, which is only
+    decoded when the request has a JSON content type, all other requests
+    are read from the uploaded files and then the POST variables.
+
+    Example:
+
+    .. code-block:: python
+
+        data = RequestData(request)
+        data.get('username')
+    """
+    __slots__ = ('request', 'data', '_layers')
+
+    def __init__(self, request, data=None):
+        """Initialize the view.
+
+        Args:
+            request (watson.http.messages.Request): the request to read from
+            data (dict): values that take precedence over the request
+        """
+        self.request = request
+        self.data = data
+        self._layers = None
+
+    @property
+    def is_json(self):
+        """Whether or not the request was submitted as JSON.
+        """
+        return 'json' in (self.request.headers.get('Content-Type') or '')
+
+    @property
+    def layers(self):
+        """The mappings that values are read from, in order of precedence.
+        """
+        if self._layers is None:
+            layers = [self.data] if self.data else []
+            if self.is_json:
+                try:
+                    body = self.request.json_body
+                except ValueError:
+                    body = None
+                if isinstance(body, dict):
+                    layers.append(body)
+            else:
+                layers.extend((self.request.files, self.request.post))
+            self._layers = tuple(layers)
+        return self._layers
+
+    def get(self, key, default=None):
+        for layer in self.layers:
+            if key in layer:
+                return layer[key]
+        return default
+
+    def __getitem__(self, key):
+        for layer in self.layers:
+            if key in layer:
+                return layer[key]
+        raise KeyError(key)
+
+    def __contains__(self, key):
+        return any(key in layer for layer in self.layers)
+
+    def __iter__(self):
+        seen = set()
+        for layer in self.layers:
+            for key in layer:
+                if key not in seen:
+                    seen.add(key)
+                    yield key
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def __repr__(self):
+        return '<{0} keys:{1}>'.format(self.__class__.__name__, len(self))
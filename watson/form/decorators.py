@@ -1,8 +1,8 @@
 # -*- coding: utf-8 -*-
 from uuid import uuid4
 import hashlib
-from watson.common.datastructures import MultiDict
 from watson.form import fields
+from watson.form.datastructures import RequestData
 from watson import validators
 
 
@@ -73,19 +73,19 @@ def has_csrf(cls):
             """
             token_name = '{0}_csrf_token'.format(self.name)
             if hasattr(data, 'post'):
-                raw_data = MultiDict()
-                raw_data.update(data.files.items())
-                for key, value in data.post.items():
+                raw_data = RequestData(data)
+                for key in raw_data:
                     if key.endswith('_csrf_token'):
-                        raw_data['csrf_token'] = value
-                    else:
-                        raw_data[key] = value
+                        raw_data = RequestData(
+                            data, {'csrf_token': raw_data[key]})
+                        break
             else:
                 if token_name in data:
                     data['csrf_token'] = data[token_name]
                     del data[token_name]
                 raw_data = data
-            self._set_data_on_fields(raw_data)
+            super(CsrfProtectedForm, CsrfProtectedForm).data.fset(
+                self, raw_data)
 
         def close(self):
             """Render the end tag of the form.
@@ -1,18 +1,26 @@
 # -*- coding: utf-8 -*-
+import copy
 from datetime import datetime
 import enum
+import functools
+import inspect
 import itertools
+from types import MappingProxyType
 from watson.common.imports import get_qualified_name
-from watson.html.elements import TagMixin, flatten_attributes
+from watson.html.elements import TagMixin
 from watson import validators, filters as filters_
-from watson.form.validators import SuppliedValues
+from watson.form import uploads
+from watson.form.datastructures import Attributes
+from watson.form.validators import (SuppliedValues, cost, ensure_sync,
+                                    first_error, gather_errors)
 
 
 class Definition(object):
     """Placeholder form element which allows for the creation of new form
     elements when the form is instantiated.
 
-
+    Definitions are shared by every instance of the form they are defined
+    on, and as such are never modified once created.
     """
     _counter = itertools.count()
 
@@ -20,12 +28,130 @@ class Definition(object):
         self.count = next(Definition._counter)
         self.class_ = class_
         self.args = args
-        self.kwargs = kwargs
+        self.kwargs = MappingProxyType(kwargs)
+        self._prototypes = {}
+
+    @property
+    def name(self):
+        """The HTML name the generated field will be given.
+
+        Falls back to the default name declared by the field class (for
+        example Csrf), or None if the field will be named after the
+        attribute it is assigned to on the form.
+        """
+        if self.kwargs.get('name'):
+            return self.kwargs['name']
+        parameter = inspect.signature(
+            self.class_.__init__).parameters.get('name')
+        if parameter and parameter.default is not parameter.empty:
+            return parameter.default or None
+        return None
 
     def generate_instance(self, form):
         cls = self.class_
-        self.kwargs['form_'] = form
-        return cls(definition=False, *self.args, **self.kwargs)
+        kwargs = {key: _copy_argument(key, value)
+                  for key, value in self.kwargs.items()}
+        kwargs['form_'] = form
+        return cls(definition=False, *self.args, **kwargs)
+
+    @property
+    def prototype(self):
+        """The fully built field that instances are cloned from.
+        """
+        return self.prototype_for(None)
+
+    def prototype_for(self, name):
+        """Return the prototype used for fields named after an attribute.
+
+        Args:
+            name (string): the name to give the field if it has none
+        """
+        prototype = self._prototypes.get(name)
+        if prototype is None:
+            prototype = self.generate_instance(None)
+            if name and not prototype.name:
+                prototype.name = name
+            prototype._shared_state = _split_state(prototype)
+            prototype = self._prototypes.setdefault(name, prototype)
+        return prototype
+
+    def clone_instance(self, form, name=None):
+        """Generate a new field by cloning the prototype.
+
+        Considerably cheaper than generate_instance as the field is not
+        initialized again, see FieldMixin.clone.
+
+        Args:
+            form (watson.form.types.Form): the form the field belongs to
+            name (string): the name to give the field if it has none
+        """
+        return self.prototype_for(name).clone(form)
+
+
+def _copy_argument(key, value):
+    # internal function to copy the containers passed to a definition so that
+    # they are never shared by the fields generated from it. Filters and
+    # validators are expected to be stateless, so only their lists are copied
+    if key in ('filters', 'validators'):
+        return list(value)
+    if isinstance(value, (list, dict, set)):
+        return copy.deepcopy(value)
+    return value
+
+
+@functools.lru_cache(maxsize=None)
+def _slot_names(cls):
+    # internal function to retrieve all the slots used by a class
+    names = []
+    for class_ in cls.__mro__:
+        slots = vars(class_).get('__slots__', ())
+        if isinstance(slots, str):
+            slots = (slots,)
+        names.extend(name for name in slots
+                     if name not in ('__dict__', '__weakref__'))
+    return tuple(names)
+
+
+# the slots that are set by FieldMixin.clone and Label.clone themselves
+_CLONED_SLOTS = frozenset(('label', 'validators', 'filters', 'form',
+                           'attributes', '_errors', '_shared_state'))
+
+
+def _split_state(source):
+    # internal function to split the slots and __dict__ of an instance into
+    # the values that can be shared with a copy, and the containers that have
+    # to be deep copied so that they are not shared
+    shared, containers = [], []
+    for name in _slot_names(source.__class__):
+        if name in _CLONED_SLOTS:
+            continue
+        try:
+            value = getattr(source, name)
+        except AttributeError:
+            continue
+        if isinstance(value, (list, dict, set)):
+            containers.append((name, value))
+        else:
+            shared.append((name, value))
+    state = getattr(source, '__dict__', None) or {}
+    return (tuple(shared), tuple(containers),
+            {key: value for key, value in state.items()
+             if not isinstance(value, (list, dict, set))},
+            {key: value for key, value in state.items()
+             if isinstance(value, (list, dict, set))})
+
+
+def _copy_state(state, target):
+    # internal function to copy the state from _split_state to an instance
+    shared, containers, shared_dict, containers_dict = state
+    for name, value in shared:
+        setattr(target, name, value)
+    for name, value in containers:
+        setattr(target, name, copy.deepcopy(value))
+    if shared_dict:
+        target.__dict__.update(shared_dict)
+    if containers_dict:
+        target.__dict__.update(copy.deepcopy(containers_dict))
 
 
 class Label(TagMixin):
@@ -36,28 +162,38 @@ class Label(TagMixin):
         html (string): the html used to render the label
         text (string): the text associated with the label
     """
+    __slots__ = ('text', 'attributes')
     html = '<label {0}>{1}</label>'
-    text = None
 
     def __init__(self, text, **kwargs):
         self.text = text
-        super(Label, self).__init__(**kwargs)
+        self.attributes = Attributes(kwargs)
+
+    def clone(self):
+        """Create a copy of the label that shares its attributes until
+        they are modified.
+        """
+        label = object.__new__(self.__class__)
+        if self.__class__ is Label and not self.__dict__:
+            label.text = self.text
+        else:
+            _copy_state(_split_state(self), label)
+        label.attributes = self.attributes.new_child()
+        return label
 
     def render(self, field=None, **kwargs):
-        attrs = self.attributes.copy()
         if 'text' in kwargs:
             self.text = kwargs['text']
             del kwargs['text']
         if 'for_' in kwargs:
-            attrs['for'] = kwargs['for_']
+            kwargs['for'] = kwargs['for_']
             del kwargs['for_']
-        attrs.update(kwargs)
         if field and 'id' not in field.attributes and field.name:
             # inject id based on field name
             id = field.name
             field.attributes['id'] = id
-            attrs['for'] = id
-        return self.html.format(flatten_attributes(attrs), self.text)
+            kwargs['for'] = id
+        return self.html.format(self.attributes.flatten(kwargs), self.text)
 
     __call__ = render
 
@@ -77,16 +213,11 @@ class FieldMixin(TagMixin):
                            value.
         filters (list): the filters that will be used prior to validation
     """
+    __slots__ = ('count', 'label', 'validators', 'filters', 'form',
+                 'attributes', '_errors', '_value', '_default_value',
+                 '_original_value', '_shared_state')
     _counter = itertools.count()
-    label = None
     html = '{0}'
-    validators = None
-    filters = None
-    _errors = None
-    _value = None
-    _default_value = None
-    _original_value = None
-    form = None
 
     def __new__(cls, definition=True, *args, **kwargs):
         if definition:
@@ -98,6 +229,8 @@ class FieldMixin(TagMixin):
         """Initializes the field with a specific name.
         """
         self.count = next(FieldMixin._counter)
+        self.form = self._default_value = self._original_value = None
+        self._shared_state = None
         if not name:
             name = ''
         self.label = Label(label or name)
@@ -115,7 +248,35 @@ class FieldMixin(TagMixin):
             self.form = kwargs['form_']
             del kwargs['form_']
         self.clear_errors()
-        super(FieldMixin, self).__init__(**kwargs)
+        self.attributes = Attributes(kwargs)
+
+    def clone(self, form=None):
+        """Create a copy of the field for use within a form.
+
+        The clone shares the filters, validators and static attributes of
+        the label and field with the original, and only stores the
+        attributes that are modified on the clone itself. Filters and
+        validators are expected to be stateless, fields that use stateful
+        ones should copy them by overriding this method. Any lists, dicts
+        and sets held by the field (such as the options of a Select) are
+        deep copied so that they are not shared with the original.
+
+        The state of a prototype is only split into the values that are
+        shared and copied once, when the prototype is created.
+
+        Args:
+            form (watson.form.types.Form): the form the clone belongs to
+        """
+        field = object.__new__(self.__class__)
+        _copy_state(self._shared_state or _split_state(self), field)
+        field._shared_state = None
+        field.attributes = self.attributes.new_child()
+        field.label = self.label.clone()
+        field.filters = list(self.filters)
+        field.validators = list(self.validators)
+        field.form = form
+        field.clear_errors()
+        return field
 
     def __process_filters(self, kwargs):
         filters = [filters_.Trim()] + kwargs.get('filters', [])
@@ -149,6 +310,12 @@ class FieldMixin(TagMixin):
         if value is None and self.default_value and self.default_value is not None:
             value = self.default_value
         self._value = value
+        self._touch_form()
+
+    def _touch_form(self):
+        # internal method to regenerate the data of the form on next access
+        if self.form is not None:
+            self.form._generation += 1
 
     @property
     def default_value(self):
@@ -170,27 +337,77 @@ class FieldMixin(TagMixin):
         Set the original_value of the field to the first value stored. Note, if
         this is called a second time, then the original value will be
         overridden.
+
+        The filters are applied to the value in turn and the filtered value
+        is only set on the field once.
         """
+        if not self.filters:
+            return
+        value = original_value = self.value
         for _filter in self.filters:
-            self._original_value = self.value
-            self.value = _filter(self.value)
+            value = _filter(value)
+        self._original_value = original_value
+        self.value = value
 
-    def validate(self, form):
+    def validate(self, form, fail_fast=False):
         """Validate the value of the field against the associated validators.
 
         Args:
             form (watson.form.types.Form): The parent form of the field.
+            fail_fast (boolean): execute the validators from cheapest to most
+                                 expensive, and stop at the first error.
 
         Returns:
             A list of errors that have occurred when the field has been
             validated.
+
+        Raises:
+            TypeError if a validator is asynchronous, see
+            FieldMixin.validate_async.
         """
         self._errors = []
-        for validator in self.validators:
+        validators_ = self.validators
+        if fail_fast:
+            validators_ = sorted(validators_, key=cost)
+        for validator in validators_:
             try:
-                validator(self.value, form=form, field=self)
+                ensure_sync(validator,
+                            validator(self.value, form=form, field=self))
             except ValueError as exc:
                 self._errors.append(str(exc))
+                if fail_fast:
+                    break
+        return self._errors
+
+    @property
+    def cost(self):
+        """The combined cost of the validators on the field.
+        """
+        return sum(cost(validator) for validator in self.validators)
+
+    async def validate_async(self, form, fail_fast=False):
+        """Validate the value of the field, awaiting asynchronous validators.
+
+        Validators that return an awaitable are awaited concurrently, see
+        watson.form.validators.gather_errors.
+
+        Args:
+            form (watson.form.types.Form): The parent form of the field.
+            fail_fast (boolean): await the validators one at a time from
+                                 cheapest to most expensive, and stop at the
+                                 first error.
+
+        Returns:
+            A list of errors that have occurred when the field has been
+            validated.
+        """
+        if fail_fast:
+            self._errors = await first_error(
+                sorted(self.validators, key=cost), self.value, form=form,
+                field=self)
+        else:
+            self._errors = await gather_errors(
+                self.validators, self.value, form=form, field=self)
         return self._errors
 
     @property
@@ -242,6 +459,7 @@ class Input(FieldMixin):
 
         input = Input(type='text')  # <input type="text" />
     """
+    __slots__ = ()
     html = '<input {0} />'
 
     def render(self, **kwargs):
@@ -250,12 +468,9 @@ class Input(FieldMixin):
         Does not need to be called directly, as will be called by __str__
         natively.
         """
-        attributes = self.attributes.copy()
-        attributes.update(kwargs)
         if self.value is not None:
-            attributes['value'] = str(self.value)
-
-        return self.html.format(flatten_attributes(attributes))
+            kwargs['value'] = str(self.value)
+        return self.html.format(self.attributes.flatten(kwargs))
 
     def render_with_label(self, **kwargs):
         """Render the element as html and include the label.
@@ -271,13 +486,14 @@ class GroupInputMixin(Input):
 
     Related form elements are wrapped in a fieldset, with a common legend.
     """
+    __slots__ = ('_values',)
     label_position = 'left'
     wrapped = True
     uselist = True
     fieldset_html = '<fieldset><legend>{0}</legend>{1}</fieldset>'
-    _values = None
 
     def __init__(self, name=None, values=None, value=None, **kwargs):
+        self._values = None
         if 'label_position' in kwargs:
             self.label_position = kwargs['label_position']
             del kwargs['label_position']
@@ -324,16 +540,15 @@ class GroupInputMixin(Input):
         id = self.attributes.get('id', self.name)
         values = self.values
         for index, label_value_pair in enumerate(values):
-            attributes = self.attributes.copy()
             label_text, value = label_value_pair
             if multiple_elements:
                 element_id = '{0}_{1}'.format(id, index)
             else:
                 element_id = id
-            attributes.update({
+            attributes = {
                 'name': self.name,
                 'id': element_id
-            })
+            }
             attributes.update(kwargs)
             if value:
                 attributes['value'] = value
@@ -347,7 +562,7 @@ class GroupInputMixin(Input):
                 checked = True
             if checked:
                 attributes['checked'] = 'checked'
-            flat_attributes = flatten_attributes(attributes)
+            flat_attributes = self.attributes.flatten(attributes)
             element = self.__render_input(
                 element_id,
                 flat_attributes,
@@ -374,13 +589,12 @@ class GroupInputMixin(Input):
         if self.has_multiple_elements() and not isinstance(value, (list, tuple)) and self.uselist:
             value = [value]
         self._value = value
+        self._touch_form()
 
     def __render_input(self, id, attributes, label_text):
         element = self.html.format(attributes)
         output = '{0}{1}'
-        attrs = self.label.attributes.copy()
-        attrs['for'] = id
-        flat_attrs = flatten_attributes(attrs)
+        flat_attrs = self.label.attributes.flatten({'for': id})
         if self.wrapped:
             if self.label_position == 'left':
                 return (
@@ -431,7 +645,7 @@ class Radio(GroupInputMixin):
 
         <label for="test"><input type="radio" name="test" values="1" />My Radio</label>
     """
-
+    __slots__ = ()
     uselist = False
 
     def __init__(self, name=None, values=None, value=None, **kwargs):
@@ -484,6 +698,7 @@ class Checkbox(GroupInputMixin):
 
         <label for="test"><input type="checkbox" name="test" value="1" />My Checkbox</label>
     """
+    __slots__ = ()
 
     def __init__(self, name=None, values=None, value=None, **kwargs):
         """Initializes the checkbox.
@@ -511,15 +726,14 @@ class Button(Input):
 
     """Creates a button, can be used instead of Input(type="button").
     """
+    __slots__ = ()
     html = '<button {0}>{1}</button>'
 
     def render(self, **kwargs):
-        attributes = self.attributes.copy()
-        attributes.update(kwargs)
-        if self.value:
-            attributes['value'] = str(self.value)
         label = kwargs.get('label', self.label.text)
-        return self.html.format(flatten_attributes(attributes), label)
+        if self.value:
+            kwargs['value'] = str(self.value)
+        return self.html.format(self.attributes.flatten(kwargs), label)
 
     def render_with_label(self, **kwargs):
         return self.render(**kwargs)
@@ -532,25 +746,19 @@ class Submit(Input):
     Attributes:
         button_mode (bool): whether or not to render as <button> or <input>
     """
-    button_mode = False
+    __slots__ = ('button_mode',)
 
     def __init__(self, name=None, value=None, button_mode=False, **kwargs):
         real_value = value or kwargs.get('label', name)
+        self.button_mode = button_mode
         if button_mode:
             self.html = '<button {0}>{1}</button>'
-            self.button_mode = True
         super(Submit, self).__init__(name, real_value, type='submit', **kwargs)
 
     def render(self, **kwargs):
         label = kwargs.pop('label') if 'label' in kwargs else self.label.text
         if self.button_mode:
-            attributes = self.attributes.copy()
-            attributes.update(kwargs)
-            return (
-                self.html.format(
-                    flatten_attributes(attributes),
-                    label)
-            )
+            return self.html.format(self.attributes.flatten(kwargs), label)
         return super(Submit, self).render()
 
     def render_with_label(self, **kwargs):
@@ -561,13 +769,12 @@ class Textarea(Input):
 
     """Creates a textarea field.
     """
+    __slots__ = ()
     html = '<textarea {0}>{1}</textarea>'
 
     def render(self, **kwargs):
-        attributes = self.attributes.copy()
-        attributes.update(kwargs)
         value = self.value if self.value else ''
-        return self.html.format(flatten_attributes(attributes), value)
+        return self.html.format(self.attributes.flatten(kwargs), value)
 
 
 class Select(FieldMixin):
@@ -580,10 +787,10 @@ class Select(FieldMixin):
         optgroup_html (string): the optgroup html element
         options (list|dict): the options available
     """
+    __slots__ = ('_options',)
     html = '<select {0}>{1}</select>'
     option_html = '<option value="{0}"{2}>{1}</option>'
     optgroup_html = '<optgroup label="{0}">{1}</optgroup>'
-    _options = None
 
     def __init__(self, name=None, options=None,
                  value=None, multiple=False, **kwargs):
@@ -626,13 +833,8 @@ class Select(FieldMixin):
         self.options = options or values
 
     def render(self, **kwargs):
-        attributes = self.attributes.copy()
-        attributes.update(kwargs)
-        return (
-            self.html.format(
-                flatten_attributes(attributes),
-                self._options_render())
-        )
+        return self.html.format(self.attributes.flatten(kwargs),
+                                self._options_render())
 
     def render_with_label(self, **kwargs):
         return ''.join((self.label.render(self), self.render(**kwargs)))
@@ -714,6 +916,7 @@ class Text(Input):
 
     """Creates an <input type="text" /> element.
     """
+    __slots__ = ()
 
     def __init__(self, name=None, value=None, **kwargs):
         super(Text, self).__init__(name, value, type='text', **kwargs)
@@ -723,16 +926,12 @@ class Date(Input):
 
     """Creates an <input type="date" /> element.
     """
-
-    format = None
+    __slots__ = ('format',)
 
     def __init__(self, name=None, value=None, format='%Y-%m-%d', **kwargs):
         self.format = format
         date_filter = filters_.Date(format)
-        if 'filters' in kwargs:
-            kwargs['filters'].append(date_filter)
-        else:
-            kwargs['filters'] = [date_filter]
+        kwargs['filters'] = list(kwargs.get('filters', ())) + [date_filter]
         if format:
             self.format = format
         super(Date, self).__init__(name, value, type='date', **kwargs)
@@ -753,6 +952,7 @@ class Email(Input):
 
     """Creates an <input type="email" /> element.
     """
+    __slots__ = ()
 
     def __init__(self, name=None, value=None, **kwargs):
         super(Email, self).__init__(name, value, type='email', **kwargs)
@@ -762,6 +962,7 @@ class Hidden(Input):
 
     """Creates an <input type="hidden" /> element.
     """
+    __slots__ = ()
 
     def __init__(self, name=None, value=None, **kwargs):
         super(Hidden, self).__init__(name, value, type='hidden', **kwargs)
@@ -771,6 +972,7 @@ class Csrf(Input):
 
     """Creates an <input type="hidden" /> element for use in csrf protection.
     """
+    __slots__ = ()
 
     def __init__(self, name='csrf_token', value=None, **kwargs):
         super(
@@ -783,11 +985,22 @@ class Csrf(Input):
                            **kwargs)
         self.validators.append(validators.Csrf())
 
+    def clone(self, form=None):
+        """Clone the field, giving it it's own token validator.
+        """
+        field = super(Csrf, self).clone(form)
+        field.validators = [
+            copy.copy(validator)
+            if isinstance(validator, validators.Csrf) else validator
+            for validator in field.validators]
+        return field
+
 
 class Password(Input):
 
     """Creates an <input type="password" /> element.
     """
+    __slots__ = ()
 
     def __init__(self, name=None, value=None, **kwargs):
         super(Password, self).__init__(name, value, type='password', **kwargs)
@@ -795,12 +1008,83 @@ class Password(Input):
 
 class File(Input):
 
-    def __init__(self, name=None, value=None, **kwargs):
+    """Creates an <input type="file" /> element.
+
+    If spool is enabled, the uploaded file is read in chunks into a
+    watson.form.uploads.Upload when the field is filtered, which is held
+    in memory until it exceeds max_memory_size and is then written to disk.
+
+    The max_size (in bytes) and content_types of the upload can be limited,
+    which are enforced while the file is spooled (and therefore enable
+    spooling). Reading stops as soon as a limit is exceeded, and the field
+    will be invalid.
+
+    The digests (such as 'sha256') of the upload can be calculated and its
+    content type sniffed while the file is spooled, which are then available
+    on the Upload. The sniffed type is also checked against content_types,
+    and if content_types are set then uploads whose type cannot be detected
+    are rejected. Only the binary formats in watson.form.uploads.SIGNATURES
+    can be detected, so sniff should not be enabled for text uploads.
+
+    Example:
+
+    .. code-block:: python
+
+        field = File(name='image', max_size=1024 * 1024,
+                     content_types=['image/*'])
+        field.value = request.files['image']
+        field.filter()
+        field.value  # <Upload filename:image.png type:image/png size:1024>
+    """
+    __slots__ = ('spool', 'max_memory_size', 'max_size', 'content_types',
+                 'digests', 'sniff', '_upload_error')
+
+    def __init__(self, name=None, value=None, spool=False,
+                 max_memory_size=uploads.DEFAULT_MAX_MEMORY_SIZE,
+                 max_size=None, content_types=None, digests=None,
+                 sniff=False, **kwargs):
+        self.spool = spool or bool(
+            max_size or content_types or digests or sniff)
+        self.max_memory_size = max_memory_size
+        self.max_size = max_size
+        self.content_types = content_types
+        self.digests = digests
+        self.sniff = sniff
+        self._upload_error = None
+        if content_types and 'accept' not in kwargs:
+            kwargs['accept'] = ','.join(content_types)
         super(File, self).__init__(name, value, type='file', **kwargs)
 
+    def filter(self):
+        """Filter the value and spool the uploaded file if required.
+        """
+        super(File, self).filter()
+        self._upload_error = None
+        value = self.value
+        if self.spool and value and not isinstance(value, uploads.Upload):
+            try:
+                self.value = uploads.spool(
+                    value, self.max_memory_size, max_size=self.max_size,
+                    content_types=self.content_types, digests=self.digests,
+                    sniff_type=self.sniff)
+            except uploads.UploadError as exc:
+                self._upload_error = str(exc)
+
+    def validate(self, form, fail_fast=False):
+        """Validate the field, failing if the upload exceeded its limits.
+        """
+        if self._upload_error:
+            self._errors = [self._upload_error]
+            return self._errors
+        return super(File, self).validate(form, fail_fast)
+
+    async def validate_async(self, form, fail_fast=False):
+        if self._upload_error:
+            self._errors = [self._upload_error]
+            return self._errors
+        return await super(File, self).validate_async(form, fail_fast)
+
     def render(self):
         """Overridden to prevent value from being put back into the field.
         """
-        attributes = self.attributes.copy()
-
-        return self.html.format(flatten_attributes(attributes))
+        return self.html.format(self.attributes.flatten())
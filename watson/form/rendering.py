@@ -0,0 +1,155 @@
+# -*- coding: utf-8 -*-
+from watson.form.fields import Input, Label
+
+
+_SENTINEL = '\x00'
+
+
+def compile_renderer(form_class, with_label=True):
+    """Retrieve the function that renders the fields of a Form class.
+
+    The HTML of each field that renders like a plain Input (such as Text,
+    Password and Email) is generated from the prototype of the field when
+    the function is compiled, so that only the value of the field has to
+    be rendered each time. Fields that have been modified since they were
+    cloned from their prototype, fields that were added to the form after
+    it was instantiated (such as http_request_method), and any other type
+    of field are rendered as they would be by Form.render.
+
+    The function is generated once and stored on the form class.
+
+    Args:
+        form_class (watson.form.types.Form): the class of the form
+        with_label (boolean): render each field with it's label
+
+    Returns:
+        A function that accepts a form and the opening and closing tags used
+        to separate the elements, and returns the HTML of the form or None
+        if fields were removed from the form after it was instantiated.
+    """
+    renderers = vars(form_class).get('_renderers')
+    if renderers is None:
+        renderers = {}
+        form_class._renderers = renderers
+    renderer = renderers.get(with_label)
+    if renderer is None:
+        renderer = renderers.setdefault(
+            with_label, _generate_renderer(form_class, with_label))
+    return renderer
+
+
+def _generate_renderer(form_class, with_label):
+    # internal function to generate the source of the render function for a
+    # form class and compile it
+    schema = form_class._schema
+    namespace = {'NAMES': list(schema.attributes),
+                 'COUNT': len(schema.attributes)}
+    render = 'field.render_with_label()' if with_label else 'str(field)'
+    lines = [
+        'def render(form, tag_open, tag_close):',
+        '    fields = form.fields',
+        '    names = list(fields)',
+        '    if names[:COUNT] != NAMES:',
+        '        return None',
+        '    parts = [form.open()]',
+        '    append = parts.append',
+    ]
+    for index, field_name in enumerate(schema.attributes):
+        prototype = schema.definitions[field_name].prototype_for(field_name)
+        lines.append('    field = fields[{0!r}]'.format(field_name))
+        if _is_compilable(prototype, with_label):
+            lines.extend(_compile_field(prototype, index, namespace,
+                                        with_label))
+            lines.append('    else:')
+            indent = '        '
+        else:
+            indent = '    '
+        lines.append(
+            '{0}append(tag_open + {1} + tag_close)'.format(indent, render))
+    lines.extend([
+        '    for name in names[COUNT:]:',
+        '        field = fields[name]',
+        '        append(tag_open + {0} + tag_close)'.format(render),
+        '    append(form.close(False))',
+        "    return ''.join(parts)",
+    ])
+    exec(compile('\n'.join(lines), '<{0} renderer>'.format(
+        form_class.__name__), 'exec'), namespace)
+    return namespace['render']
+
+
+def _is_compilable(prototype, with_label):
+    # internal function to determine whether a field renders as a plain input
+    cls = prototype.__class__
+    if cls.render is not Input.render:
+        return False
+    if not with_label:
+        return True
+    return cls.render_with_label is Input.render_with_label \
+        and prototype.label.__class__ is Label \
+        and isinstance(prototype.label.text, str)
+
+
+def _compile_field(prototype, index, namespace, with_label):
+    # internal function to generate the lines that render a field which is
+    # unmodified since it was cloned from the prototype
+    attributes = prototype.attributes
+    extra, labels = {}, ['']
+    guards = ['a._data is None', 'a._parent is P{0}'.format(index),
+              'P{0}._version == {1}'.format(index, attributes._version)]
+    namespace['P{0}'.format(index)] = attributes
+    lines = ['    a = field.attributes']
+    if with_label:
+        label_attributes = prototype.label.attributes
+        text = prototype.label.text
+        labels = [Label.html.format(label_attributes.flatten(), text)]
+        if 'id' not in attributes and prototype.name:
+            # mirrors Label.render, which injects the id into the field and
+            # only renders the for attribute when it does so
+            extra['id'] = prototype.name
+            labels.insert(0, Label.html.format(
+                label_attributes.flatten({'for': prototype.name}), text))
+            guards[0] = '(a._data is None or a._data == I{0})'.format(index)
+            namespace['I{0}'.format(index)] = {'id': prototype.name}
+        namespace['L{0}'.format(index)] = label_attributes
+        lines.append('    label = field.label')
+        guards.extend([
+            'label.text == {0!r}'.format(text),
+            'label.attributes._data is None',
+            'label.attributes._parent is L{0}'.format(index),
+            'L{0}._version == {1}'.format(index, label_attributes._version),
+        ])
+    empty = prototype.html.format(attributes.flatten(extra))
+    with_value = prototype.html.format(
+        attributes.flatten(dict(extra, value=_SENTINEL)))
+    before, after = with_value.split(_SENTINEL)
+    lines.extend([
+        '    if {0}:'.format(' and '.join(guards)),
+        '        value = field.value',
+        "        value = '' if value is None else str(value)",
+    ])
+    indent = '        '
+    if len(labels) > 1:
+        lines.extend([
+            '        if a._data is None:',
+            "            a['id'] = {0!r}".format(prototype.name),
+        ])
+        lines.extend(_append_lines(
+            '            ', labels[0], before, after, empty))
+        lines.append('        else:')
+        indent = '            '
+    lines.extend(_append_lines(indent, labels[-1], before, after, empty))
+    return lines
+
+
+def _append_lines(indent, label, before, after, empty):
+    # internal function to generate the lines that append the html of a field
+    # depending on whether or not it has a value
+    return [
+        '{0}if value:'.format(indent),
+        '{0}    append(tag_open + {1!r} + value + {2!r} + tag_close)'.format(
+            indent, label + before, after),
+        '{0}else:'.format(indent),
+        '{0}    append(tag_open + {1!r} + tag_close)'.format(
+            indent, label + empty),
+    ]
@@ -1,10 +1,17 @@
 # -*- coding: utf-8 -*-
+import asyncio
 import collections
+from concurrent.futures import ProcessPoolExecutor
+import functools
+import itertools
+import operator
+from types import MappingProxyType
+from watson.form.datastructures import Attributes, LazyFields, RequestData
 from watson.form.fields import File, Hidden, Definition
-from watson.html.elements import TagMixin, flatten_attributes
-from watson.common.contextmanagers import suppress
-from watson.common.datastructures import MultiDict
-from watson.common.decorators import cached_property
+from watson.form.rendering import compile_renderer
+from watson.form.validators import (dependencies, ensure_sync, first_error,
+                                    gather_errors)
+from watson.html.elements import TagMixin
 from watson.common.imports import get_qualified_name
 from watson.http import messages
 
@@ -26,33 +33,112 @@ class FieldDescriptor(object):
         self.name = name
 
     def __get__(self, instance, owner):
-        field = instance.fields[self.name]
+        if instance is None:
+            return self
+        try:
+            field = instance.fields[self.name]
+        except KeyError:
+            raise AttributeError(self.name)
         if instance._rendering:
             return field
         return field.value
 
     def __set__(self, instance, value):
-        instance.fields[self.name].value = value
+        try:
+            field = instance.fields[self.name]
+        except KeyError:
+            raise AttributeError(self.name)
+        field.value = value
+
+
+class FormSchema(collections.namedtuple(
+        'FormSchema',
+        'definitions attributes names name_index attribute_index multipart '
+        'multiple_value')):
+    """The compiled field layout of a Form class.
+
+    Generated once by FormMeta when the class is created so that
+    instantiating the form only has to perform per-request work.
+
+    Attributes:
+        definitions (mapping): the field definitions keyed by attribute name
+        attributes (tuple): the attribute names of the fields in order
+        names (tuple): the HTML names of the fields in order
+        name_index (mapping): the HTML name to attribute name index
+        attribute_index (mapping): the attribute name to HTML name index
+        multipart (boolean): whether a field requires multipart/form-data
+        multiple_value (frozenset): the attribute names of the fields that
+                                    are able to contain multiple values
+    """
+    __slots__ = ()
+
+    @classmethod
+    def compile(cls, definitions):
+        """Compile the schema from an iterable of (attribute, definition).
+
+        Args:
+            definitions (iterable): pairs of attribute name and Definition
+        """
+        definitions = sorted(definitions, key=lambda pair: pair[1].count)
+        attributes = tuple(field_name for field_name, _ in definitions)
+        names = tuple(definition.name or field_name
+                      for field_name, definition in definitions)
+        return cls(
+            definitions=MappingProxyType(
+                collections.OrderedDict(definitions)),
+            attributes=attributes,
+            names=names,
+            name_index=MappingProxyType(dict(zip(names, attributes))),
+            attribute_index=MappingProxyType(dict(zip(attributes, names))),
+            multipart=any(issubclass(definition.class_, File)
+                          for _, definition in definitions),
+            multiple_value=frozenset(
+                field_name for field_name, definition in definitions
+                if hasattr(definition.class_, 'has_multiple_value')))
 
 
 class FormMeta(type):
-    """Assigns the FieldDescriptor objects to the Form object.
+    """Compiles the FormSchema and assigns the FieldDescriptor objects to the
+    Form object.
     """
     def __init__(cls, name, bases, attrs):
-        fields = []
-        for field_name in dir(cls):
-            if (not field_name.startswith('_') and  # noqa
-                    field_name not in IGNORED_ATTRIBUTES):
-                field = getattr(cls, field_name)
-                if isinstance(field, Definition):
-                    fields.append((field_name, field))
-        fields.sort(key=lambda pair: pair[1].count)
-        cls._defined_fields = collections.OrderedDict(fields)
+        definitions = {}
+        for base in reversed(cls.__mro__[1:]):
+            if '_schema' in vars(base):
+                definitions.update(base._schema.definitions)
+            else:
+                definitions.update(_find_definitions(vars(base)))
+        for field_name in attrs:
+            definitions.pop(field_name, None)
+        definitions.update(_find_definitions(attrs))
+        cls._schema = FormSchema.compile(definitions.items())
+        cls._defined_fields = cls._schema.definitions
+        for field_name in cls._schema.attributes:
+            if not isinstance(_class_attribute(cls, field_name),
+                              FieldDescriptor):
+                setattr(cls, field_name, FieldDescriptor(field_name))
 
     def __call__(cls, *args, **kwargs):
         return type.__call__(cls, *args, **kwargs)
 
 
+def _class_attribute(cls, name):
+    # internal function to retrieve an attribute without invoking descriptors
+    for class_ in cls.__mro__:
+        if name in vars(class_):
+            return vars(class_)[name]
+    return None
+
+
+def _find_definitions(attrs):
+    # internal function to find the field definitions within a class dict
+    for field_name, field in attrs.items():
+        if field_name.startswith('_') or field_name in IGNORED_ATTRIBUTES:
+            continue
+        if isinstance(field, Definition):
+            yield field_name, field
+
+
 class Form(TagMixin, metaclass=FormMeta):
     """Declarative HTML <form> management.
 
@@ -74,19 +160,43 @@ class Form(TagMixin, metaclass=FormMeta):
         {% form.text.render_with_label() %} # <label for="text">My TextField</label><input id="text" name="text" type="text" value="Something" />
         {% form.another %}  # <input name="another[]" />
         {% form.close() %}  # </form>
+
+    The state of the form (including its fields) is held in __slots__.
+    TagMixin does not define __slots__ though, so instances still carry a
+    __dict__, which is left empty unless attributes are set by subclasses or
+    the fail_fast and incremental modes are overridden for an instance.
+
+    Attributes:
+        clone_fields (boolean): whether fields are cloned from a prototype
+                                built once per definition rather than
+                                initialized for each form instance.
+        fail_fast (boolean): whether validation stops at the first error,
+                             see is_valid.
+        incremental (boolean): whether only the fields with values that have
+                               changed since the last validation are
+                               filtered and validated again.
+        compile_rendering (boolean): whether the form is rendered by a
+                                     function generated for the class, see
+                                     watson.form.rendering. The fields are
+                                     cloned as with clone_fields.
     """
-    _fields = None
-    _mapped_fields = None
-    _rendering = False
-    _ignored_bound_fields = None
-    _bound_object = None
-    _bound_object_mapping = None
-    _validated = False
-    values_provider = None
+    __slots__ = ('attributes', 'validators', 'values_provider',
+                 '_rendering', '_ignored_bound_fields',
+                 '_bound_object', '_bound_object_mapping', '_validated',
+                 '_valid', '_form_errors', '_partially_validated',
+                 '_field_states', '_validator_states', '_generation',
+                 '_cache', '_pending_hydration', '_hydrated_values',
+                 '_accessors', '_fields')
+    clone_fields = False
+    fail_fast = False
+    incremental = False
+    compile_rendering = False
+    http_request_method = FieldDescriptor('http_request_method')
 
     def __init__(self, name=None, method='post',
                  action=None, detect_multipart=True, validators=None,
-                 values_provider=None, **kwargs):
+                 values_provider=None, fail_fast=None, incremental=None,
+                 **kwargs):
         """Inititalize the form and set some default attributes.
 
         Args:
@@ -94,7 +204,24 @@ class Form(TagMixin, metaclass=FormMeta):
             method (string): the http method to use
             action (string): the url to submit the form to
             detect_multipart (boolean): automatically set multipart/form-data
+            fail_fast (boolean): override the fail_fast mode of the form
+            incremental (boolean): override the incremental mode of the form
         """
+        self._fields = None
+        self._generation = 0
+        self._cache = {}
+        self._form_errors = []
+        self._bound_object = self._bound_object_mapping = None
+        self._accessors = self._pending_hydration = None
+        self._hydrated_values = {}
+        self._rendering = self._validated = self._valid = False
+        self._partially_validated = False
+        self._field_states = {}
+        self._validator_states = {}
+        if fail_fast is not None:
+            self.fail_fast = fail_fast
+        if incremental is not None:
+            self.incremental = incremental
         self._ignored_bound_fields = []
         self.validators = validators or []
         if action and isinstance(action, messages.Request):
@@ -108,7 +235,7 @@ class Form(TagMixin, metaclass=FormMeta):
         if '_class' in kwargs:
             kwargs['class'] = kwargs.get('_class')
             del kwargs['_class']
-        self.attributes = collections.ChainMap({
+        self.attributes = Attributes({
             'name': name or self.__class__.__name__,
             'method': method.lower(),
             'action': action or '/',
@@ -126,51 +253,90 @@ class Form(TagMixin, metaclass=FormMeta):
                 definition=False))
 
     def _add_field(self, field_name, field):
+        field.form = self
         self.fields[field_name] = field
-        setattr(self.__class__, field_name, FieldDescriptor(field_name))
+        if not isinstance(_class_attribute(self.__class__, field_name),
+                          FieldDescriptor):
+            setattr(self.__class__, field_name, FieldDescriptor(field_name))
 
     def _detect_multipart(self, should_detect):
-        if should_detect:
-            for field_name, field in self.fields.items():
-                if isinstance(field, File):
-                    self.attributes['enctype'] = 'multipart/form-data'
+        if should_detect and self._schema.multipart:
+            self.attributes['enctype'] = 'multipart/form-data'
 
     def _set_values_provider(self, values_provider):
         self.values_provider = values_provider
-        values_provider_fields = dir(values_provider)
-        for field_name, field in self.fields.items():
+        if values_provider is None:
+            return
+        values_provider_fields = set(dir(values_provider))
+        for field_name in self._schema.attributes:
             if field_name in values_provider_fields:
-                field.values = getattr(values_provider, field_name)
+                self.fields[field_name].values = getattr(
+                    values_provider, field_name)
 
     # field methods
 
-    @cached_property
+    @property
     def fields(self):
-        self._mapped_fields = {}
-        fields = collections.OrderedDict()
-        for field_name, field in self.defined_fields.items():
-            instance = field.generate_instance(self)
-            setattr(self.__class__, field_name, FieldDescriptor(field_name))
-            if not instance.name:
-                instance.name = field_name
-            self._mapped_fields[instance.name] = instance
-            fields[field_name] = instance
+        """The fields of the form keyed by their attribute name.
+
+        Each field is only instantiated the first time it is accessed.
+        """
+        fields = self._fields
+        if fields is None:
+            fields = self._fields = LazyFields(
+                self._schema.attributes, self._generate_field)
         return fields
 
+    def _generate_field(self, field_name):
+        # internal method to instantiate a field on first access
+        definition = self._schema.definitions[field_name]
+        if self.clone_fields or self.compile_rendering:
+            instance = definition.clone_instance(self, field_name)
+        else:
+            instance = definition.generate_instance(self)
+        if not instance.name:
+            instance.name = field_name
+        if self._pending_hydration and field_name in self._pending_hydration:
+            self._pending_hydration.discard(field_name)
+            self.__hydrate_obj_to_form((field_name, instance))
+        return instance
+
     @property
     def defined_fields(self):
-        return self._defined_fields
+        return self._schema.definitions
 
     # data methods
 
-    @cached_property
+    @property
+    def generation(self):
+        """The number of times the data on the form has changed.
+
+        Incremented whenever the value of a field is set, or the form is
+        invalidated or validated. The data, raw_data and errors are only
+        generated once per generation.
+        """
+        return self._generation
+
+    def _cached(self, name, factory):
+        # internal method to retrieve a value generated once per generation,
+        # callers must copy it before handing it out so that it can't be
+        # modified
+        cached = self._cache.get(name)
+        if cached is not None and cached[0] == self._generation:
+            return cached[1]
+        value = factory()
+        self._cache[name] = (self._generation, value)
+        return value
+
+    @property
     def raw_data(self):
         """Returns a dict containing all the original field values.
 
         Field values will be their pre-filtered values.
         """
-        return {field_name: field.original_value for
-                field_name, field in self.fields.items()}
+        return dict(self._cached('raw_data', lambda: {
+            field_name: field.original_value
+            for field_name, field in self.fields.items()}))
 
     @property
     def data(self):
@@ -179,61 +345,81 @@ class Form(TagMixin, metaclass=FormMeta):
         Used as a shorthand method to retrieve data from all the form fields
         rather than having to access the fields themselves.
         """
-        return {field_name: field.value for
-                field_name, field in self.fields.items()}
+        return dict(self._cached('data', lambda: {
+            field_name: field.value
+            for field_name, field in self.fields.items()}))
+
+    @property
+    def changed_data(self):
+        """Returns a dict containing the field values that have changed.
+
+        Values are compared to the values that were hydrated from the bound
+        object, or None for the fields that were not hydrated. Fields that
+        were hydrated are only set on the bound object when the form is valid
+        if their values have changed.
+        """
+        return dict(self._cached('changed_data', lambda: {
+            field_name: field.value
+            for field_name, field in self.fields.items()
+            if self._has_changed(field_name, field)}))
+
+    def _has_changed(self, field_name, field):
+        # internal method to compare a field to the value it was hydrated
+        # with, where an empty submission is equal to None
+        previous, value = self._hydrated_values.get(field_name), field.value
+        if _is_empty(previous) and _is_empty(value):
+            return False
+        return not _is_unchanged(previous, value)
 
     @data.setter
     def data(self, data):
         """Sets the data for the form.
 
         Iterates through all the fields on the form and injects the value.
+        Requests are read through a RequestData view rather than copied.
 
         Args:
             data (dict|watson.http.messages.Request): A dict of key/value pairs to populate the form with.
         """
         self.invalidate()
+        self._pending_hydration = None
         if hasattr(data, 'post'):
-            raw_data = MultiDict()
-            raw_data.update(data.post.items())
-            try:
-                raw_data.update(data.json_body)
-            except Exception:
-                pass
-            for key, value in data.files.items():
-                # need to do this rather than .update due to File objects
-                # being named tuples
-                raw_data[key] = value
-        else:
-            raw_data = data
-        self._set_data_on_fields(raw_data)
+            data = RequestData(data)
+        self._set_data_on_fields(data)
 
     def _set_data_on_fields(self, data):
         # internal method for setting the data on the fields
-        for key in self._mapped_fields:
+        schema = self._schema
+        fields = self.fields
+        for key, real_key in zip(schema.names, schema.attributes):
             if key not in self._ignored_bound_fields:
-                field = self._mapped_fields[key]
-                real_key = {f: name for name, f in self.fields.items()}.get(
-                    field)
-                value = data.get(key, data.get(real_key))
-                if hasattr(field, 'has_multiple_value') \
+                field = fields[real_key]
+                value = data[key] if key in data else data.get(real_key)
+                if real_key in schema.multiple_value \
                         and field.has_multiple_value():
                     if value:
                         if not isinstance(value, (tuple, list)):
                             value = [value]
                     else:
                         value = []
-                setattr(self, real_key, value)
+                field.value = value
 
     # error methods
 
-    @cached_property
+    @property
     def errors(self):
         """Returns a list of errors associated with the form.
 
         If the form has not been validated yet, calling this property
         will cause validation to occur.
         """
-        self.is_valid()
+        if not self.validated:
+            self.is_valid()
+        return {name: dict(error) for name, error
+                in self._cached('errors', self._collect_errors).items()}
+
+    def _collect_errors(self):
+        # internal method to gather the errors from the fields and form
         errors = {}
         for field_name, field in self.fields.items():
             error_list = field.errors
@@ -250,7 +436,8 @@ class Form(TagMixin, metaclass=FormMeta):
     def bound_object(self):
         return self._bound_object
 
-    def bind(self, obj=None, mapping=None, ignored_fields=None, hydrate=True):
+    def bind(self, obj=None, mapping=None, ignored_fields=None, hydrate=True,
+             lazy=False):
         """Binds an object to the form.
 
         Optionally additional mapping can be specified in order to set values on
@@ -264,6 +451,9 @@ class Form(TagMixin, metaclass=FormMeta):
             mapping (dict): the mapping between the form fields and obj attributes.
             ignored_fields (list|tuple): fields to ignore when binding.
             bool hydrate: whether or not to hydrate the form with the obj attributes.
+            bool lazy: whether or not to defer hydrating each field until the
+                       field is first accessed, the fields that have already
+                       been accessed are hydrated immediately.
 
         Example:
 
@@ -279,9 +469,80 @@ class Form(TagMixin, metaclass=FormMeta):
             self._bound_object = obj
             if mapping:
                 self._bound_object_mapping = mapping
+            self._accessors = None
+            self.__accessors()
         self.invalidate()
+        self._pending_hydration = None
+        self._hydrated_values = {}
         if obj and hydrate:
-            self.__hydrate_obj_to_form()
+            if lazy:
+                fields = self.fields
+                instantiated = fields.instantiated
+                self._pending_hydration = set(fields) - set(instantiated)
+                self.__hydrate_obj_to_form(
+                    *((field_name, fields[field_name])
+                      for field_name in instantiated))
+            else:
+                self.__hydrate_obj_to_form(*self.fields.items())
+
+    @classmethod
+    def attribute_paths(cls, mapping=None, ignored_fields=None):
+        """Return the attribute paths that are read from and written to an
+        object bound to the form.
+
+        Args:
+            mapping (dict): the mapping between the form fields and obj attributes.
+            ignored_fields (list|tuple): fields to ignore when binding.
+
+        Returns:
+            A tuple of paths in the order of the fields, where each path is a
+            tuple of attribute names.
+
+        Example:
+
+        .. code-block:: python
+
+            LoginForm.attribute_paths({'email': ('contact', 'email')})
+            # (('username',), ('contact', 'email'))
+        """
+        mapping = mapping or {}
+        ignored_fields = ignored_fields or ()
+        paths = []
+        for field_name in cls._schema.attributes:
+            path = tuple(mapping.get(field_name, (field_name,)))
+            if path[-1] not in ignored_fields:
+                paths.append(path)
+        return tuple(paths)
+
+    @classmethod
+    def relationship_paths(cls, mapping=None, ignored_fields=None):
+        """Return the paths of the related objects that are traversed when
+        an object is bound to the form.
+
+        Useful for eager loading the relationships of an object before it is
+        bound, rather than loading each relationship as it is traversed.
+
+        Args:
+            mapping (dict): the mapping between the form fields and obj attributes.
+            ignored_fields (list|tuple): fields to ignore when binding.
+
+        Returns:
+            A tuple of unique paths, where each path is a tuple of attribute
+            names and is preceded by its parent paths.
+
+        Example:
+
+        .. code-block:: python
+
+            paths = LoginForm.relationship_paths(mapping)
+            # (('personal',), ('personal', 'contact'))
+            query.options(*(joinedload('.'.join(path)) for path in paths))
+        """
+        paths = {}
+        for path in cls.attribute_paths(mapping, ignored_fields):
+            for index in range(1, len(path)):
+                paths.setdefault(path[:index], None)
+        return tuple(paths)
 
     # validation methods
 
@@ -295,13 +556,11 @@ class Form(TagMixin, metaclass=FormMeta):
         This is called automatically when data is bound to the form and
         sets the forms validity to invalid.
         """
-        attrs = ('_data', '_raw_data', '_errors', '_form_errors')
-        for attr in attrs:
-            with suppress(AttributeError):
-                delattr(self, attr)
-        self._validated = self._valid = False
+        self._generation += 1
+        self._form_errors = []
+        self._validated = self._valid = self._partially_validated = False
 
-    def is_valid(self):
+    def is_valid(self, fail_fast=None):
         """Determine whether or not the form and relating values are valid.
 
         Filter all the values on the fields associated with the form, and
@@ -309,29 +568,266 @@ class Form(TagMixin, metaclass=FormMeta):
         steps if the form has not been previously validated, or has
         been invalidated.
 
+        In incremental mode the filtered value and errors of each field are
+        kept after validation, and are reused when the form is validated
+        again and the value of the field is unchanged. The form validators
+        are only executed again when a field has changed, or when one of
+        the fields they depend on has changed if they declare their
+        dependencies (see watson.form.validators.depends_on). Field validators
+        must therefore only depend on the value of their own field, any
+        validation across fields belongs in the form validators.
+
+        In fail fast mode the fields are validated from the cheapest to the
+        most expensive (see watson.form.validators.cost) and validation
+        stops at the first error, so the errors will only contain the first
+        error that was found.
+
+        Args:
+            fail_fast (boolean): override the fail_fast mode of the form
+
         Returns:
             boolean value depending on the validity of the form.
         """
-        if not self.validated:
-            self._form_errors = []
-            self._valid = True
-            for field_name, field in self.fields.items():
-                field.filter()
-                valid = field.validate(self)
-                if len(valid) > 0:
-                    self._valid = False
-            if self._valid:
-                for validator in self.validators:
-                    try:
-                        validator(self)
-                    except ValueError as exc:
-                        self._valid = False
-                        self._form_errors.append(str(exc))
+        if fail_fast is None:
+            fail_fast = self.fail_fast
+        if not self.validated or (
+                self._partially_validated and not fail_fast):
+            self._valid = self._validate(fail_fast)
             self._validated = True
+            self._generation += 1
+            self._partially_validated = fail_fast and not self._valid
         if self._valid and self._bound_object:
             self.__hydrate_form_to_obj()
         return self._valid
 
+    async def is_valid_async(self, fail_fast=None):
+        """Determine whether or not the form and relating values are valid.
+
+        Behaves the same as is_valid, however any validators on the fields
+        or form may be coroutine functions (or return awaitables). All the
+        fields are filtered first, and then the field validators are awaited
+        concurrently. If all the fields are valid, the form validators are
+        then awaited concurrently.
+
+        In fail fast mode the fields and their validators are instead awaited
+        one at a time from the cheapest to the most expensive, followed by
+        the form validators, and validation stops at the first error.
+
+        Args:
+            fail_fast (boolean): override the fail_fast mode of the form
+
+        Returns:
+            boolean value depending on the validity of the form.
+        """
+        if fail_fast is None:
+            fail_fast = self.fail_fast
+        if not self.validated or (
+                self._partially_validated and not fail_fast):
+            self._valid = await self._validate_async(fail_fast)
+            self._validated = True
+            self._generation += 1
+            self._partially_validated = fail_fast and not self._valid
+        if self._valid and self._bound_object:
+            self.__hydrate_form_to_obj()
+        return self._valid
+
+    async def _validate_async(self, fail_fast=False):
+        # internal method to filter and concurrently validate the fields and
+        # the form, or one at a time when failing fast
+        self._form_errors = []
+        fields = list(self.fields.values())
+        for field in fields:
+            field.filter()
+        if fail_fast:
+            fields.sort(key=operator.attrgetter('cost'))
+            valid = True
+            for index, field in enumerate(fields):
+                if await field.validate_async(self, fail_fast=True):
+                    valid = False
+                    for remaining in fields[index + 1:]:
+                        remaining.clear_errors()
+                    break
+        else:
+            errors = await asyncio.gather(
+                *(field.validate_async(self) for field in fields))
+            valid = not any(errors)
+        if valid:
+            gather = first_error if fail_fast else gather_errors
+            self._form_errors = await gather(self.validators, self)
+            valid = not self._form_errors
+        return valid
+
+    def _validate(self, fail_fast=None):
+        # internal method to filter and validate the fields and the form
+        if fail_fast is None:
+            fail_fast = self.fail_fast
+        self._form_errors = []
+        valid = True
+        changed = not self.incremental
+        fields = list(self.fields.items())
+        if fail_fast:
+            fields.sort(key=lambda item: item[1].cost)
+        for index, (field_name, field) in enumerate(fields):
+            errors, field_changed = self._validate_field(
+                field_name, field, fail_fast)
+            changed = changed or field_changed
+            if errors:
+                valid = False
+                if fail_fast:
+                    for _, remaining in fields[index + 1:]:
+                        remaining.clear_errors()
+                    break
+        if valid:
+            self._form_errors = self._run_form_validators(fail_fast, changed)
+            valid = not self._form_errors
+        return valid
+
+    def _validate_field(self, field_name, field, fail_fast):
+        # internal method to filter and validate a field, returning the errors
+        # and whether or not the field was validated again
+        if not self.incremental:
+            field.filter()
+            return field.validate(self, fail_fast), True
+        value = field.value
+        state = self._field_states.get(field_name)
+        if state and _is_unchanged(state[0], value) \
+                and state[1] in (fail_fast, None):
+            _, _, field.value, field._original_value, errors = state
+            field._errors = list(errors)
+            return field._errors, False
+        field.filter()
+        errors = field.validate(self, fail_fast)
+        self._field_states[field_name] = (
+            value, fail_fast if errors else None, field.value,
+            field._original_value, tuple(errors))
+        return errors, True
+
+    def _run_form_validators(self, fail_fast, changed=True,
+                             field_names=None):
+        # internal method to execute the form validators, optionally only
+        # those that depend on a subset of the fields
+        errors = []
+        for validator in self.validators:
+            depends_on = dependencies(validator)
+            if field_names is not None and depends_on is not None \
+                    and not field_names.issuperset(depends_on):
+                continue
+            if self.incremental:
+                error = self._run_form_validator_incrementally(
+                    validator, depends_on, changed)
+            else:
+                error = _form_validator_error(validator, self)
+            if error:
+                errors.append(error)
+                if fail_fast:
+                    break
+        return errors
+
+    def _run_form_validator_incrementally(self, validator, depends_on,
+                                          changed):
+        # internal method to execute a form validator, reusing the result of
+        # the previous execution if the fields it depends on are unchanged
+        if depends_on is None:
+            values = None
+        else:
+            values = tuple(self.fields[field_name].value
+                           for field_name in depends_on)
+        state = self._validator_states.get(id(validator))
+        if state and state[0] is validator:
+            if values is None:
+                unchanged = not changed
+            else:
+                unchanged = all(_is_unchanged(previous, value) for
+                                previous, value in zip(state[1], values))
+            if unchanged:
+                return state[2]
+        error = _form_validator_error(validator, self)
+        self._validator_states[id(validator)] = (validator, values, error)
+        return error
+
+    def validate_fields(self, *field_names, form_validators=False):
+        """Filter and validate a subset of the fields on the form.
+
+        Only the named fields are filtered and validated, which allows a
+        single field to be validated (for example via an AJAX request) or
+        a form to be validated in steps. The validity of the form as a
+        whole is left untouched.
+
+        Form validators that declare their dependencies are only executed
+        if all the fields they depend on have been named.
+
+        Args:
+            field_names (string): the attribute names of the fields
+            form_validators (boolean): whether or not to also execute the
+                                       form validators if the fields are valid
+
+        Returns:
+            A dict of errors for the fields, in the same format as
+            Form.errors.
+
+        Example:
+
+        .. code-block:: python
+
+            errors = form.validate_fields('username', 'email')
+        """
+        errors = {}
+        for field_name in field_names:
+            field = self.fields[field_name]
+            field_errors, _ = self._validate_field(
+                field_name, field, self.fail_fast)
+            if field_errors:
+                errors[field_name] = {'messages': field_errors,
+                                      'label': field.label.text}
+        if form_validators and not errors:
+            form_errors = self._run_form_validators(
+                self.fail_fast, field_names=frozenset(field_names))
+            if form_errors:
+                errors['form'] = {'messages': form_errors, 'label': 'Form'}
+        self._generation += 1
+        return errors
+
+    @classmethod
+    def validate_many(cls, records, *args, workers=None, chunk_size=1000,
+                      **kwargs):
+        """Validate many records against the form.
+
+        A single form is instantiated and reused to filter and validate
+        every record, which is considerably faster than instantiating a new
+        form for each record. Objects bound to the form are never hydrated.
+
+        If workers is specified then the records are split into chunks and
+        validated across a pool of processes, each of which instantiates its
+        own form. Only the form class, the arguments and the chunks of
+        records are sent to the processes, so the form class must be
+        importable and the arguments and records picklable. The results are
+        generated in the same order as the records.
+
+        Args:
+            records (iterable): the dicts of data to validate
+            args: the positional arguments used to instantiate the form
+            workers (int): the number of processes to validate with
+            chunk_size (int): the number of records sent to a process at once
+            kwargs: the keyword arguments used to instantiate the form
+
+        Returns:
+            A generator of (data, errors) tuples, one for each record, where
+            data is the filtered data and errors are in the same format as
+            Form.errors.
+
+        Example:
+
+        .. code-block:: python
+
+            for data, errors in LoginForm.validate_many(rows):
+                if errors:
+                    ...
+        """
+        if workers:
+            return _validate_in_processes(
+                cls, records, args, kwargs, workers, chunk_size)
+        return _validate_records(cls, records, args, kwargs)
+
     # rendering methods
 
     def open(self, **kwargs):
@@ -340,10 +836,7 @@ class Form(TagMixin, metaclass=FormMeta):
         Any addition kwargs will be used within the attributes.
         """
         self._rendering = True
-        attrs = self.attributes.copy()
-        if kwargs:
-            attrs.update(kwargs)
-        return '<form {0}>'.format(flatten_attributes(attrs))
+        return '<form {0}>'.format(self.attributes.flatten(kwargs))
 
     def close(self, include_http_request=True):
         """Render the end tag of the form.
@@ -373,6 +866,11 @@ class Form(TagMixin, metaclass=FormMeta):
         Returns:
             A string representation of the form.
         """
+        if self.compile_rendering:
+            html = compile_renderer(self.__class__, with_label)(
+                self, '<{0}>'.format(with_tag), '</{0}>'.format(with_tag))
+            if html is not None:
+                return html
         html = '{open}{fields}{close}'
         fields = ['<{0}>{1}</{0}>'.format(with_tag,
                                           field.render_with_label() if with_label else str(field))
@@ -417,45 +915,44 @@ class Form(TagMixin, metaclass=FormMeta):
 
     # hydration and internal methods
 
-    def __hydrate_obj_to_form(self):
-        # should never be called externally. Triggered by bind.
-        obj_mapping = self._bound_object_mapping or {}
-        for field_name, field in self.fields.items():
-            current_obj = self.bound_object
-            attr = field_name
-            if field_name in obj_mapping:
-                attr = obj_mapping[field_name][-1]
-                fields = obj_mapping[field_name][0:-1]
-                for name in fields:
-                    try:
-                        current_obj = getattr(current_obj, name)
-                    except Exception:
-                        raise AttributeError(
-                            'Mapping for object does not match object structure.')
+    def __accessors(self):
+        # internal method to retrieve the accessors resolved when the object
+        # was bound, which are only resolved again if fields have been added
+        accessors = self._accessors
+        if accessors is None or len(accessors) != len(self.fields):
+            mapping = self._bound_object_mapping or {}
+            accessors = self._accessors = _compile_accessors(
+                tuple(self.fields),
+                tuple((field_name, tuple(path))
+                      for field_name, path in mapping.items()))
+        return accessors
+
+    def __hydrate_obj_to_form(self, *fields):
+        # should never be called externally. Triggered by bind and when a
+        # field is first accessed after binding lazily.
+        obj = self.bound_object
+        accessors = self.__accessors()
+        for field_name, field in fields:
+            parent, attr, _ = accessors[field_name]
+            current_obj = _resolve_parent(obj, parent)
             if hasattr(current_obj, attr) and attr not in self._ignored_bound_fields:
                 value = getattr(current_obj, attr)
-                setattr(self, field_name, value)
-                # self.fields[field_name].value = value
+                self._hydrated_values[field_name] = value
+                field.value = value
 
     def __hydrate_form_to_obj(self):
-        # should never be called externally. Triggered by is_valid.
-        obj_mapping = self._bound_object_mapping or {}
-        for field_name in self.data:
+        # should never be called externally. Triggered by is_valid. Fields
+        # that were hydrated from the object are only set if they changed.
+        obj = self.bound_object
+        accessors = self.__accessors().items()
+        for field_name, (parent, attr, multiple_attr_setter) in accessors:
             field = self.fields[field_name]
-            current_obj = self.bound_object
+            if field_name in self._hydrated_values \
+                    and not self._has_changed(field_name, field):
+                continue
+            current_obj = _resolve_parent(obj, parent)
             value = field.value
-            attr = field_name
-            if field_name in obj_mapping:
-                fields = obj_mapping[field_name][0:-1]
-                attr = obj_mapping[field_name][-1]
-                for name in fields:
-                    try:
-                        current_obj = getattr(current_obj, name)
-                    except Exception:
-                        raise AttributeError(
-                            'Mapping for object does not match object structure.')
             if hasattr(current_obj, attr) and attr not in self._ignored_bound_fields:
-                multiple_attr_setter = 'set_{}'.format(attr)
                 try:
                     if hasattr(field, 'has_multiple_value')\
                             and field.has_multiple_value()\
@@ -473,6 +970,97 @@ class Form(TagMixin, metaclass=FormMeta):
                     pass
 
 
+@functools.lru_cache(maxsize=256)
+def _compile_accessors(field_names, mapping):
+    # internal function to resolve the object path of each field once per
+    # combination of fields and mapping, returning the getter for the parent
+    # object, the attribute and its setter name keyed by the field name
+    mapping = dict(mapping)
+    accessors = {}
+    for field_name in field_names:
+        path = mapping.get(field_name, (field_name,))
+        parent = None
+        if len(path) > 1:
+            parent = operator.attrgetter('.'.join(path[:-1]))
+        attr = path[-1]
+        accessors[field_name] = (parent, attr, 'set_{}'.format(attr))
+    return MappingProxyType(accessors)
+
+
+def _resolve_parent(obj, parent):
+    # internal function to retrieve the object that holds a mapped attribute
+    if parent is None:
+        return obj
+    try:
+        return parent(obj)
+    except Exception:
+        raise AttributeError(
+            'Mapping for object does not match object structure.')
+
+
+def _form_validator_error(validator, form):
+    # internal function to execute a form validator and return the error
+    try:
+        ensure_sync(validator, validator(form))
+    except ValueError as exc:
+        return str(exc)
+    return None
+
+
+def _is_empty(value):
+    # internal function to determine whether a value is None or empty string
+    return value is None or (isinstance(value, str) and not value)
+
+
+def _is_unchanged(previous, value):
+    # internal function to compare a value to the previously validated value
+    if previous is value:
+        return True
+    if type(previous) is not type(value):
+        return False
+    try:
+        return bool(previous == value)
+    except Exception:
+        return False
+
+
+def _validate_records(form_class, records, args, kwargs):
+    # internal function to validate records against a single form
+    form = form_class(*args, **kwargs)
+    for record in records:
+        form._set_data_on_fields(record)
+        form._validate()
+        yield form.data, form._collect_errors()
+
+
+def _validate_chunk(form_class, records, args, kwargs):
+    # internal function executed by the processes of _validate_in_processes
+    return list(_validate_records(form_class, records, args, kwargs))
+
+
+def _validate_in_processes(form_class, records, args, kwargs, workers,
+                           chunk_size):
+    # internal function to validate chunks of records across processes,
+    # keeping a bounded number of chunks in flight so that records are
+    # streamed rather than read into memory all at once
+    records = iter(records)
+    pending = collections.deque()
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        try:
+            while True:
+                chunk = list(itertools.islice(records, chunk_size))
+                if chunk:
+                    pending.append(executor.submit(
+                        _validate_chunk, form_class, chunk, args, kwargs))
+                if pending and (not chunk or len(pending) > workers * 2):
+                    yield from pending.popleft().result()
+                elif not chunk:
+                    break
+        finally:
+            for future in pending:
+                future.cancel()
+
+
 class Multipart(Form):
 
     """Convenience class for forms that should be multipart/form-data.
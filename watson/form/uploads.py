@@ -0,0 +1,273 @@
+# -*- coding: utf-8 -*-
+import contextlib
+import hashlib
+import tempfile
+
+
+DEFAULT_MAX_MEMORY_SIZE = 1024 * 1024
+CHUNK_SIZE = 64 * 1024
+SIZE_MESSAGE = 'File must not be larger than {max_size} bytes.'
+TYPE_MESSAGE = '"{type}" is not an allowed file type.'
+UNKNOWN_TYPE_MESSAGE = 'The type of the file could not be detected.'
+READ_MESSAGE = 'File has already been read and cannot be read again.'
+SNIFF_SIZE = 32
+SIGNATURES = (
+    (0, b'\x89PNG\r\n\x1a\n', 'image/png'),
+    (0, b'\xff\xd8\xff', 'image/jpeg'),
+    (0, b'GIF87a', 'image/gif'),
+    (0, b'GIF89a', 'image/gif'),
+    (0, b'BM', 'image/bmp'),
+    (0, b'II*\x00', 'image/tiff'),
+    (0, b'MM\x00*', 'image/tiff'),
+    (8, b'WEBP', 'image/webp'),
+    (0, b'%PDF-', 'application/pdf'),
+    (0, b'PK\x03\x04', 'application/zip'),
+    (0, b'\x1f\x8b', 'application/gzip'),
+    (0, b'OggS', 'audio/ogg'),
+    (0, b'ID3', 'audio/mpeg'),
+    (4, b'ftyp', 'video/mp4'),
+)
+
+
+class UploadError(ValueError):
+
+    """Raised when an upload exceeds the limits of a File field.
+    """
+
+
+class Upload(object):
+
+    """A file that has been uploaded via a File field.
+
+    The contents of the file are held in memory until they exceed the
+    max_memory_size of the field, and are then written to a temporary file
+    on disk.
+
+    Example:
+
+    .. code-block:: python
+
+        upload = form.fields['image'].value
+        upload.filename  # 'image.png'
+        for chunk in upload:
+            storage.write(chunk)
+    """
+    __slots__ = ('file', 'filename', 'type', 'size', 'digests',
+                 'sniffed_type')
+
+    def __init__(self, file, filename=None, type=None, size=0, digests=None,
+                 sniffed_type=None):
+        """Initialize the upload.
+
+        Args:
+            file (file): the spooled contents of the upload
+            filename (string): the name of the file on the client
+            type (string): the content type declared by the client
+            size (int): the size of the contents in bytes
+            digests (dict): the hex digests of the contents keyed by algorithm
+            sniffed_type (string): the content type detected from the contents
+        """
+        self.file = file
+        self.filename = filename
+        self.type = type
+        self.size = size
+        self.digests = digests or {}
+        self.sniffed_type = sniffed_type
+
+    @property
+    def in_memory(self):
+        """Whether or not the contents of the upload are held in memory.
+        """
+        return not getattr(self.file, '_rolled', False)
+
+    def read(self, size=-1):
+        return self.file.read(size)
+
+    def seek(self, offset, whence=0):
+        return self.file.seek(offset, whence)
+
+    def close(self):
+        self.file.close()
+
+    def __iter__(self):
+        self.file.seek(0)
+        return iter(lambda: self.file.read(CHUNK_SIZE), b'')
+
+    def __bool__(self):
+        return True
+
+    def __repr__(self):
+        return '<{0} filename:{1} type:{2} size:{3}>'.format(
+            self.__class__.__name__, self.filename, self.type, self.size)
+
+
+def chunks(source, chunk_size=CHUNK_SIZE):
+    """Read the contents of an upload in chunks.
+
+    File-like sources are read from the start, and their position is
+    restored once they have been read so that the same source can be read
+    again (for example by another form bound to the same request).
+
+    Args:
+        source: a watson.http File, a file-like object, bytes or an iterable
+                of bytes
+
+    Raises:
+        UploadError if the source cannot be rewound and has already been read.
+
+    Returns:
+        A generator of bytes.
+    """
+    source = getattr(source, 'data', source)
+    if isinstance(source, str):
+        source = source.encode('utf-8')
+    if isinstance(source, (bytes, bytearray)):
+        yield bytes(source)
+        return
+    stream, position = source, None
+    if hasattr(stream, 'read'):
+        position = _rewind(stream)
+        source = iter(lambda: stream.read(chunk_size) or None, None)
+    try:
+        for chunk in source:
+            if isinstance(chunk, str):
+                chunk = chunk.encode('utf-8')
+            if chunk:
+                yield chunk
+    finally:
+        if position is not None:
+            stream.seek(position)
+
+
+def _rewind(stream):
+    # internal function to seek a stream back to its start, returning the
+    # position to restore, or None if the stream cannot be rewound
+    try:
+        seekable = stream.seekable()
+    except AttributeError:
+        seekable = hasattr(stream, 'seek') and hasattr(stream, 'tell')
+    try:
+        position = stream.tell()
+    except (AttributeError, OSError):
+        position = None
+    if not seekable:
+        if position:
+            raise UploadError(READ_MESSAGE)
+        return None
+    stream.seek(0)
+    return position
+
+
+def is_allowed_type(type, content_types):
+    """Determine whether a content type matches any of the allowed types.
+
+    Args:
+        type (string): the content type, such as 'image/png'
+        content_types (list): the allowed types, which may be wildcards such
+                              as 'image/*'
+    """
+    type = (type or 'application/octet-stream').split(';')[0].strip().lower()
+    for content_type in content_types:
+        content_type = content_type.lower()
+        if content_type in ('*/*', type):
+            return True
+        if content_type.endswith('/*') \
+                and type.startswith(content_type[:-1]):
+            return True
+    return False
+
+
+def sniff(head):
+    """Detect the content type of a file from its first bytes.
+
+    Args:
+        head (bytes): at least the first SNIFF_SIZE bytes of the file
+
+    Returns:
+        The content type, or None if it could not be detected.
+    """
+    for offset, signature, type in SIGNATURES:
+        if head.startswith(signature, offset):
+            return type
+    return None
+
+
+def spool(source, max_memory_size=DEFAULT_MAX_MEMORY_SIZE,
+          chunk_size=CHUNK_SIZE, max_size=None, content_types=None,
+          digests=None, sniff_type=False):
+    """Write the contents of an upload to a spooled temporary file.
+
+    The source is read in chunks from its start so that it is never held in
+    memory in its entirety, unless it is smaller than max_memory_size, see
+    chunks. The declared type
+    is checked before the source is read, and reading stops as soon as the
+    source exceeds max_size.
+
+    The digests of the contents are calculated and the content type sniffed
+    as the source is read. If the content type is sniffed then it is also
+    checked against content_types once it has been detected, and an upload
+    whose type cannot be detected (see SIGNATURES) is rejected when
+    content_types are set.
+
+    Args:
+        source: a watson.http File, a file-like object, bytes or an iterable
+                of bytes
+        max_memory_size (int): the number of bytes held in memory before the
+                               contents are written to disk
+        chunk_size (int): the number of bytes read from the source at once
+        max_size (int): the maximum number of bytes allowed
+        content_types (list): the content types allowed
+        digests (list): the names of the hashlib algorithms to calculate
+        sniff_type (boolean): whether or not to sniff the content type
+
+    Raises:
+        UploadError if the upload exceeds max_size, is not an allowed type or
+        has already been read and cannot be rewound.
+
+    Returns:
+        An Upload.
+    """
+    type = getattr(source, 'type', None)
+    if content_types and not is_allowed_type(type, content_types):
+        raise UploadError(TYPE_MESSAGE.format(type=type))
+    hashes = [hashlib.new(name) for name in digests or ()]
+    file = tempfile.SpooledTemporaryFile(max_size=max_memory_size)
+    size = 0
+    head = b'' if sniff_type else None
+    sniffed_type = None
+    try:
+        with contextlib.closing(chunks(source, chunk_size)) as contents:
+            for chunk in contents:
+                size += len(chunk)
+                if max_size is not None and size > max_size:
+                    raise UploadError(SIZE_MESSAGE.format(max_size=max_size))
+                if head is not None:
+                    head += chunk[:SNIFF_SIZE]
+                    if len(head) >= SNIFF_SIZE:
+                        sniffed_type = _check_sniffed(head, content_types)
+                        head = None
+                for digest in hashes:
+                    digest.update(chunk)
+                file.write(chunk)
+        if head:
+            sniffed_type = _check_sniffed(head, content_types)
+    except UploadError:
+        file.close()
+        raise
+    file.seek(0)
+    return Upload(file, filename=getattr(source, 'filename', None),
+                  type=type, size=size, sniffed_type=sniffed_type,
+                  digests={digest.name: digest.hexdigest()
+                           for digest in hashes})
+
+
+def _check_sniffed(head, content_types):
+    # internal function to sniff the type of an upload and abort the upload if
+    # it is not allowed, or could not be detected when the type is restricted
+    sniffed_type = sniff(head)
+    if content_types:
+        if sniffed_type is None:
+            raise UploadError(UNKNOWN_TYPE_MESSAGE)
+        if not is_allowed_type(sniffed_type, content_types):
+            raise UploadError(TYPE_MESSAGE.format(type=sniffed_type))
+    return sniffed_type
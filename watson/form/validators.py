@@ -1,7 +1,22 @@
 # -*- coding: utf-8 -*-
+import asyncio
+import inspect
+from watson import validators
 from watson.validators import abc
 
 
+DEFAULT_COST = 10
+COSTS = {
+    validators.Required: 1,
+    validators.Csrf: 1,
+    validators.Length: 2,
+    validators.Range: 2,
+    validators.RegEx: 20,
+}
+ASYNC_MESSAGE = ('{0} returned an awaitable, forms with asynchronous '
+                 'validators must be validated with Form.is_valid_async.')
+
+
 class SuppliedValues(abc.Validator):
 
     """Validate that a value exists in the list of supplied values.
@@ -15,6 +30,7 @@ class SuppliedValues(abc.Validator):
         validator('Testing maximum')  # raises ValueError
     """
 
+    cost = 5
     message = None
 
     def __init__(self, message='"{value}" is not a valid option.'):
@@ -28,3 +44,134 @@ class SuppliedValues(abc.Validator):
             value = ', '.join(str(v) for v in value) if isinstance(value, iterable) else value
             raise ValueError(self.message.format(value=value))
         return True
+
+
+async def gather_errors(validators, *args, **kwargs):
+    """Execute the validators concurrently and return their error messages.
+
+    Validators may either be regular callables, or return an awaitable (such
+    as a coroutine function). All the awaitables are awaited concurrently.
+
+    Args:
+        validators (list): the validators to execute
+        args: the positional arguments passed to each validator
+        kwargs: the keyword arguments passed to each validator
+
+    Returns:
+        A list of the error messages in the same order as the validators.
+    """
+    async def execute(validator):
+        try:
+            result = validator(*args, **kwargs)
+            if inspect.isawaitable(result):
+                await result
+        except ValueError as exc:
+            return str(exc)
+        return None
+    messages = await asyncio.gather(
+        *(execute(validator) for validator in validators))
+    return [message for message in messages if message is not None]
+
+
+async def first_error(validators, *args, **kwargs):
+    """Execute the validators one at a time, stopping at the first error.
+
+    Validators may either be regular callables, or return an awaitable.
+
+    Args:
+        validators (list): the validators to execute in order
+        args: the positional arguments passed to each validator
+        kwargs: the keyword arguments passed to each validator
+
+    Returns:
+        A list containing the first error message, or an empty list.
+    """
+    for validator in validators:
+        messages = await gather_errors((validator,), *args, **kwargs)
+        if messages:
+            return messages
+    return []
+
+
+def ensure_sync(validator, result):
+    """Ensure that a validator did not return an awaitable.
+
+    Asynchronous validators are only awaited by Form.is_valid_async, and
+    would otherwise silently pass during synchronous validation.
+
+    Args:
+        validator (callable): the validator that was executed
+        result: the value returned by the validator
+
+    Raises:
+        TypeError if the result is awaitable, which is closed first.
+    """
+    if inspect.isawaitable(result):
+        close = getattr(result, 'close', None)
+        if close is not None:
+            close()
+        raise TypeError(ASYNC_MESSAGE.format(validator))
+
+
+def cost(validator):
+    """Return the relative cost of executing a validator.
+
+    The cost is retrieved from the cost attribute of the validator if it has
+    been declared, or from COSTS based on the type of the validator, and
+    otherwise defaults to DEFAULT_COST. Cheaper validators are executed first
+    when validating in fail fast mode.
+
+    Example:
+
+    .. code-block:: python
+
+        class PasswordStrength(object):
+            cost = 50
+
+            def __call__(self, value, **kwargs):
+                ...
+    """
+    value = getattr(validator, 'cost', None)
+    if value is not None:
+        return value
+    for class_ in type(validator).__mro__:
+        if class_ in COSTS:
+            return COSTS[class_]
+    return DEFAULT_COST
+
+
+def depends_on(*field_names):
+    """Declare the fields that a form validator depends on.
+
+    Form validators that declare their dependencies are only executed again
+    on incremental forms when one of the fields has changed, and are
+    executed by Form.validate_fields when all of the fields are validated.
+    Validators can also declare a depends_on attribute directly.
+
+    Args:
+        field_names (string): the attribute names of the fields
+
+    Example:
+
+    .. code-block:: python
+
+        @depends_on('password', 'confirm_password')
+        def passwords_match(form):
+            if form.password != form.confirm_password:
+                raise ValueError('Passwords do not match.')
+    """
+    def decorator(validator):
+        validator.depends_on = field_names
+        return validator
+    return decorator
+
+
+def dependencies(validator):
+    """Return the fields that a form validator depends on.
+
+    Returns:
+        A tuple of field names, or None if the validator depends on the
+        whole form.
+    """
+    field_names = getattr(validator, 'depends_on', None)
+    return None if field_names is None else tuple(field_names)